@@ -1 +1,2 @@
+from alcherializer.registry import compile_all
 from alcherializer.serializer import Serializer
@@ -0,0 +1,90 @@
+import abc
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+)
+
+
+class BaseCache(abc.ABC):
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abc.abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Dict[Hashable, Any]) -> None:
+        for key, value in items.items():
+            self.set(key, value)
+
+    def lookup_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        values = self.get_many(keys)
+
+        misses = values.count(None)
+        self.misses += misses
+        self.hits += len(values) - misses
+
+        return values
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class LRUCache(BaseCache):
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,85 @@
+import datetime
+import decimal
+import enum
+import json
+import math
+import uuid
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def normalize_key(key: Any) -> Any:
+    if isinstance(key, enum.Enum):
+        key = key.value
+
+    if isinstance(key, (datetime.date, datetime.time)):
+        return key.isoformat()
+
+    if isinstance(key, uuid.UUID):
+        return str(key)
+
+    if isinstance(key, float) and not math.isfinite(key):
+        return "null"
+
+    return key
+
+
+def normalize(value: Any) -> Any:
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+
+    if isinstance(value, dict):
+        return {
+            normalize_key(key): normalize(item) for key, item in value.items()
+        }
+
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+
+    return value
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, default=default, option=orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Like integers beyond 64 bits, left to the standard library
+            pass
+
+    try:
+        return stdlib_dumps(value)
+    except (TypeError, ValueError):
+        # Mirrors orjson: NaN and infinity become null, keys become strings
+        return stdlib_dumps(normalize(value))
+
+
+def stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value,
+        default=default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode()
@@ -1,2 +1,6 @@
 class MalformedMetaClassException(Exception):
     pass
+
+
+class InvalidDataException(Exception):
+    pass
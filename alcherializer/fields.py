@@ -1,46 +1,242 @@
+import copy
+import datetime
+import decimal
+import enum
+import re
+import uuid
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Hashable,
     List,
+    Optional,
+    Sequence,
     Tuple,
+    Type,
     Union,
 )
 
 import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from alcherializer.instrumentation import IS_VALID
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def as_array(values: Sequence) -> Any:
+    try:
+        array = numpy.asarray(values)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    return array if array.ndim == 1 else None
+
+
+ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+    r"(?:([+-])(\d{2}):?(\d{2}))?$"
+)
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    # fromisoformat only accepts "Z" from Python 3.11
+    if value[-1:] in ("Z", "z"):
+        value = value[:-1] + "+00:00"
+
+    if hasattr(datetime.datetime, "fromisoformat"):
+        return datetime.datetime.fromisoformat(value)
+
+    match = ISO_DATETIME.match(value)
+    if match is None:
+        raise ValueError(f"Invalid isoformat string: {value!r}")
+
+    (
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        fraction,
+        sign,
+        offset_hours,
+        offset_minutes,
+    ) = match.groups()
+
+    tzinfo = None
+    if sign is not None:
+        offset = datetime.timedelta(
+            hours=int(offset_hours), minutes=int(offset_minutes)
+        )
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second or 0),
+        int((fraction or "0").ljust(6, "0")),
+        tzinfo=tzinfo,
+    )
+
+
+def parse_date(value: str) -> datetime.date:
+    if hasattr(datetime.date, "fromisoformat"):
+        return datetime.date.fromisoformat(value)
+
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
 
 
 class BaseField:
+    __slots__ = ("name", "nullable", "_field", "_checks")
+
+    MIN_VECTORIZED_SIZE: int = 64
+
+    SHORT_CIRCUIT_CHECKS: Tuple[str, ...] = ("check_if_required_and_filled",)
+
+    _check_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._check_names = cls._get_check_names()
+
     def __init__(self, name: str = None, field: sqlalchemy.Column = None):
         self.name = name
         self.field = field
+        self._checks: Union[
+            List[Tuple[Callable[[Any], Tuple[bool, Any]], bool]], None
+        ] = None
+
+    @property
+    def field(self) -> Any:
+        return self._field
+
+    @field.setter
+    def field(self, field: Any) -> None:
+        self._field = field
+        self._load_field_options(field)
 
     def cast(self, value) -> Any:
         return value
 
     def run_validator(self, value: Any) -> Tuple[bool, List[str]]:
-        errors = []
-        for method_name in dir(self):
-            if not method_name.startswith("check_if_"):
-                continue
+        checks = self._checks
+        if checks is None:
+            checks = self._checks = self._get_checks()
 
-            executable = getattr(self, method_name)
+        cast_value = self.cast(value)
 
-            cast_value = self.cast(value)
-            ok, error = executable(cast_value)
+        errors = []
+        for check, short_circuits in checks:
+            ok, error = check(cast_value)
             if not ok:
                 errors.append(error)
+                if short_circuits:
+                    break
 
         return len(errors) <= 0, errors
 
+    def run_column_validator(
+        self, values: Sequence
+    ) -> Tuple[List[bool], Dict[int, List[str]]]:
+        mask = []
+        errors = {}
+        for position, value in enumerate(values):
+            valid, field_errors = self.run_validator(value)
+            mask.append(valid)
+            if not valid:
+                errors[position] = field_errors
+
+        return mask, errors
+
+    def profiled(self, profiler: Any, name: str) -> "BaseField":
+        validator = copy.copy(self)
+        validator._checks = validator._get_checks(
+            lambda method_name, check: profiler.timed(
+                f"{name}.{method_name}", check, IS_VALID
+            )
+        )
+
+        return validator
+
+    def _get_checks(
+        self, wrap: Callable[[str, Callable], Callable] = None
+    ) -> List[Tuple[Callable[[Any], Tuple[bool, Any]], bool]]:
+        method_names = [
+            method_name
+            for method_name in self._check_names
+            if method_name in self.SHORT_CIRCUIT_CHECKS
+        ] + [
+            method_name
+            for method_name in self._check_names
+            if method_name not in self.SHORT_CIRCUIT_CHECKS
+        ]
+
+        checks = []
+        for method_name in method_names:
+            check = getattr(self, method_name)
+            if wrap is not None:
+                check = wrap(method_name, check)
+
+            checks.append((check, method_name in self.SHORT_CIRCUIT_CHECKS))
+
+        return checks
+
+    def _can_vectorize(self, field_class: type, values: Sequence) -> bool:
+        return (
+            numpy is not None
+            and len(values) >= self.MIN_VECTORIZED_SIZE
+            and self._check_names == field_class._check_names
+            and type(self).cast is field_class.cast
+        )
+
+    def _complete_column_validation(
+        self, values: Sequence, mask: Any
+    ) -> Tuple[List[bool], Dict[int, List[str]]]:
+        errors = {}
+        for position in numpy.flatnonzero(~mask).tolist():
+            valid, field_errors = self.run_validator(values[position])
+            if valid:
+                mask[position] = True
+                continue
+
+            errors[position] = field_errors
+
+        return mask.tolist(), errors
+
+    def _load_field_options(self, field: Any) -> None:
+        self.nullable = getattr(field, "nullable", True)
+
+    @classmethod
+    def _get_check_names(cls) -> Tuple[str, ...]:
+        return tuple(
+            method_name
+            for method_name in dir(cls)
+            if method_name.startswith("check_if_")
+        )
+
     def check_if_required_and_filled(
         self, value
     ) -> Tuple[bool, Union[str, None]]:
-        if not self.field.nullable and (value is None or value == ""):
+        if not self.nullable and (value is None or value == ""):
             return False, "Can't be blank"
 
         return True, None
 
 
+BaseField._check_names = BaseField._get_check_names()
+
+
 class BooleanField(BaseField):
+    __slots__ = ()
+
     VALID_TRUES: List = ["True", "T", "true", "t", True, 1, "1"]
 
     VALID_FALSES: List = ["False", "F", "false", "f", False, 0, "0"]
@@ -53,6 +249,35 @@ class BooleanField(BaseField):
 
         return value
 
+    def run_column_validator(
+        self, values: Sequence
+    ) -> Tuple[List[bool], Dict[int, List[str]]]:
+        array = (
+            as_array(values)
+            if self._can_vectorize(BooleanField, values)
+            else None
+        )
+        if array is None:
+            return super().run_column_validator(values)
+
+        if array.dtype.kind == "b":
+            mask = numpy.ones(len(array), dtype=bool)
+        elif array.dtype.kind in "iuf":
+            mask = numpy.isin(array, [0, 1])
+        elif array.dtype.kind == "U":
+            mask = numpy.isin(
+                array,
+                [
+                    value
+                    for value in self.VALID_TRUES + self.VALID_FALSES
+                    if isinstance(value, str)
+                ],
+            )
+        else:
+            return super().run_column_validator(values)
+
+        return self._complete_column_validation(values, mask)
+
     def check_if_is_a_valid_boolean(
         self, value
     ) -> Tuple[bool, Union[str, None]]:
@@ -63,28 +288,348 @@ class BooleanField(BaseField):
 
 
 class IntegerField(BaseField):
+    __slots__ = ()
+
     def cast(self, value) -> int:
         if value is None:
             return 0
 
         return int(value)
 
+    def run_column_validator(
+        self, values: Sequence
+    ) -> Tuple[List[bool], Dict[int, List[str]]]:
+        array = (
+            as_array(values)
+            if self._can_vectorize(IntegerField, values)
+            else None
+        )
+        if array is None:
+            return super().run_column_validator(values)
+
+        if array.dtype.kind in "biu":
+            mask = numpy.ones(len(array), dtype=bool)
+        elif array.dtype.kind == "f":
+            mask = numpy.isfinite(array)
+        else:
+            return super().run_column_validator(values)
+
+        return self._complete_column_validation(values, mask)
+
 
 class StringField(BaseField):
+    __slots__ = ("length",)
+
     def cast(self, value) -> str:
         if value is None:
             return ""
 
         return str(value)
 
+    def _load_field_options(self, field: Any) -> None:
+        super()._load_field_options(field)
+        self.length = getattr(getattr(field, "type", None), "length", None)
+
     def check_if_length_is_under_limit(
         self, value: str
     ) -> Tuple[bool, Union[str, None]]:
-        if self.field.type.length and len(value) > self.field.type.length:
-            return False, f"Limit of characters is {self.field.type.length}"
+        if self.length and len(value) > self.length:
+            return False, f"Limit of characters is {self.length}"
+
+        return True, None
+
+
+class FloatField(BaseField):
+    __slots__ = ()
+
+    def cast(self, value) -> float:
+        if isinstance(value, float) or isinstance(value, bool):
+            return value
+
+        if isinstance(value, (int, str, decimal.Decimal)):
+            try:
+                return float(value)
+            except ValueError:
+                return value
+
+        return value
+
+    def check_if_is_a_valid_float(self, value) -> Tuple[bool, Union[str, None]]:
+        if value is not None and not isinstance(value, float):
+            return False, "Not a valid number"
 
         return True, None
 
 
+class DecimalField(BaseField):
+    __slots__ = ("precision", "scale")
+
+    def cast(self, value) -> decimal.Decimal:
+        if isinstance(value, decimal.Decimal) or isinstance(value, bool):
+            return value
+
+        if isinstance(value, (int, float, str)):
+            try:
+                return decimal.Decimal(
+                    repr(value) if isinstance(value, float) else value
+                )
+            except decimal.InvalidOperation:
+                return value
+
+        return value
+
+    def _load_field_options(self, field: Any) -> None:
+        super()._load_field_options(field)
+        field_type = getattr(field, "type", None)
+        self.precision = getattr(field_type, "precision", None)
+        self.scale = getattr(field_type, "scale", None)
+
+    def check_if_is_a_valid_decimal(
+        self, value
+    ) -> Tuple[bool, Union[str, None]]:
+        if value is None:
+            return True, None
+
+        if not isinstance(value, decimal.Decimal) or not value.is_finite():
+            return False, "Not a valid number"
+
+        return True, None
+
+    def check_if_precision_is_respected(
+        self, value
+    ) -> Tuple[bool, Union[str, None]]:
+        if not isinstance(value, decimal.Decimal) or not value.is_finite():
+            return True, None
+
+        _, digits, exponent = value.as_tuple()
+        decimal_places = max(0, -exponent)
+        total_digits = max(len(digits), decimal_places) + max(0, exponent)
+
+        if self.scale is not None and decimal_places > self.scale:
+            return False, f"Limit of decimal places is {self.scale}"
+
+        if self.precision and total_digits > self.precision:
+            return False, f"Limit of digits is {self.precision}"
+
+        if (
+            self.precision
+            and self.scale is not None
+            and total_digits - decimal_places > self.precision - self.scale
+        ):
+            return (
+                False,
+                "Limit of digits before the decimal point is "
+                f"{self.precision - self.scale}",
+            )
+
+        return True, None
+
+
+class DateTimeField(BaseField):
+    __slots__ = ()
+
+    def cast(self, value) -> datetime.datetime:
+        if isinstance(value, str):
+            try:
+                return parse_datetime(value)
+            except ValueError:
+                return value
+
+        return value
+
+    def check_if_is_a_valid_datetime(
+        self, value
+    ) -> Tuple[bool, Union[str, None]]:
+        if value is not None and not isinstance(value, datetime.datetime):
+            return False, "Not a valid datetime"
+
+        return True, None
+
+
+class DateField(BaseField):
+    __slots__ = ()
+
+    def cast(self, value) -> datetime.date:
+        if isinstance(value, datetime.datetime):
+            return value.date()
+
+        if isinstance(value, str):
+            try:
+                return parse_date(value)
+            except ValueError:
+                return value
+
+        return value
+
+    def check_if_is_a_valid_date(self, value) -> Tuple[bool, Union[str, None]]:
+        if value is not None and not isinstance(value, datetime.date):
+            return False, "Not a valid date"
+
+        return True, None
+
+
+class EnumField(BaseField):
+    __slots__ = ("enum_class", "choices")
+
+    def cast(self, value) -> Any:
+        enum_class = self.enum_class
+        if enum_class is None or value is None or isinstance(value, enum_class):
+            return value
+
+        try:
+            return enum_class(value)
+        except ValueError:
+            pass
+
+        try:
+            return enum_class[value]
+        except (KeyError, TypeError):
+            return value
+
+    def _load_field_options(self, field: Any) -> None:
+        super()._load_field_options(field)
+        field_type = getattr(field, "type", None)
+        self.enum_class: Optional[Type[enum.Enum]] = getattr(
+            field_type, "enum_class", None
+        )
+        self.choices = frozenset(getattr(field_type, "enums", ()))
+
+    def check_if_is_a_valid_choice(
+        self, value
+    ) -> Tuple[bool, Union[str, None]]:
+        if value is None or value == "":
+            return True, None
+
+        if self.enum_class is not None:
+            valid = isinstance(value, self.enum_class)
+        else:
+            valid = not self.choices or value in self.choices
+
+        if not valid:
+            return False, "Not a valid choice"
+
+        return True, None
+
+
+class JSONField(BaseField):
+    __slots__ = ()
+
+    JSON_TYPES: Tuple[type, ...] = (str, int, float, bool, type(None))
+
+    def check_if_is_a_valid_json(self, value) -> Tuple[bool, Union[str, None]]:
+        pending = [value]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, self.JSON_TYPES):
+                continue
+
+            if isinstance(item, dict):
+                if not all(isinstance(key, str) for key in item):
+                    return False, "Not a valid JSON"
+
+                pending.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                pending.extend(item)
+            else:
+                return False, "Not a valid JSON"
+
+        return True, None
+
+
+class UUIDField(BaseField):
+    __slots__ = ("as_uuid",)
+
+    def _load_field_options(self, field: Any) -> None:
+        super()._load_field_options(field)
+        # postgresql.UUID binds strings unless as_uuid is set
+        self.as_uuid = getattr(getattr(field, "type", None), "as_uuid", True)
+
+    def cast(self, value) -> Union[uuid.UUID, str]:
+        if isinstance(value, str):
+            try:
+                value = uuid.UUID(value)
+            except ValueError:
+                return value
+
+        if isinstance(value, uuid.UUID) and not self.as_uuid:
+            return str(value)
+
+        return value
+
+    def check_if_is_a_valid_uuid(self, value) -> Tuple[bool, Union[str, None]]:
+        if value is None or isinstance(value, uuid.UUID):
+            return True, None
+
+        if not self.as_uuid and isinstance(value, str):
+            try:
+                uuid.UUID(value)
+                return True, None
+            except ValueError:
+                pass
+
+        return False, "Not a valid UUID"
+
+
 class MethodField(BaseField):
-    pass
+    __slots__ = ("memo_key",)
+
+    def __init__(
+        self,
+        name: str = None,
+        field: sqlalchemy.Column = None,
+        memo_key: Callable[[Any], Hashable] = None,
+    ):
+        super().__init__(name, field)
+        self.memo_key = memo_key
+
+
+field_classes: Dict[type, Type[BaseField]] = {}
+
+_resolved_field_classes: Dict[type, Optional[Type[BaseField]]] = {}
+
+
+def register_field(type_class: type, field_class: Type[BaseField]) -> None:
+    field_classes[type_class] = field_class
+    _resolved_field_classes.clear()
+
+
+def get_field_class(column_type: Any) -> Type[BaseField]:
+    type_class = (
+        column_type if isinstance(column_type, type) else type(column_type)
+    )
+
+    try:
+        field_class = _resolved_field_classes[type_class]
+    except KeyError:
+        field_class = _resolved_field_classes[type_class] = next(
+            (
+                field_classes[base_class]
+                for base_class in type_class.__mro__
+                if base_class in field_classes
+            ),
+            None,
+        )
+
+    if field_class is not None:
+        return field_class
+
+    impl = getattr(column_type, "impl", None)
+    if issubclass(type_class, sqlalchemy.types.TypeDecorator) and impl:
+        return get_field_class(impl)
+
+    return BaseField
+
+
+register_field(sqlalchemy.Boolean, BooleanField)
+register_field(sqlalchemy.Integer, IntegerField)
+register_field(sqlalchemy.String, StringField)
+register_field(sqlalchemy.Enum, EnumField)
+register_field(sqlalchemy.Numeric, DecimalField)
+register_field(sqlalchemy.Float, FloatField)
+register_field(sqlalchemy.DateTime, DateTimeField)
+register_field(sqlalchemy.Date, DateField)
+register_field(sqlalchemy.Interval, BaseField)
+register_field(sqlalchemy.JSON, JSONField)
+register_field(postgresql.UUID, UUIDField)
+if hasattr(sqlalchemy, "Uuid"):  # pragma: no cover
+    register_field(sqlalchemy.Uuid, UUIDField)
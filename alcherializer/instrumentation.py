@@ -0,0 +1,84 @@
+import copy
+import time
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+DATA = "data"
+IS_VALID = "is_valid"
+
+
+class Profiler:
+    def __init__(self, on_span: Callable[[Dict[str, Any]], None] = None):
+        self.on_span = on_span
+        self.prefix = ""
+        self._stats: Dict[str, Dict[str, List[float]]] = {
+            DATA: {},
+            IS_VALID: {},
+        }
+        self._lock = Lock()
+
+    def child(self, name: str) -> "Profiler":
+        child = copy.copy(self)
+        child.prefix = f"{self.prefix}{name}."
+
+        return child
+
+    def timed(
+        self, name: str, func: Callable[..., Any], operation: str = DATA
+    ) -> Callable[..., Any]:
+        name = self.prefix + name
+        with self._lock:
+            stat = self._stats[operation].setdefault(name, [0, 0.0])
+
+        lock = self._lock
+        on_span = self.on_span
+        perf_counter = time.perf_counter
+
+        def timed_func(*args, **kwargs) -> Any:
+            started_at = time.time_ns() if on_span else 0
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - started
+                with lock:
+                    stat[0] += 1
+                    stat[1] += elapsed
+
+                if on_span:
+                    on_span(
+                        {
+                            "name": f"{operation} {name}",
+                            "start_time": started_at,
+                            "end_time": started_at + int(elapsed * 1e9),
+                            "attributes": {
+                                "alcherializer.operation": operation,
+                                "alcherializer.field": name,
+                            },
+                        }
+                    )
+
+        return timed_func
+
+    def reset(self) -> None:
+        with self._lock:
+            for stats in self._stats.values():
+                for stat in stats.values():
+                    stat[0] = 0
+                    stat[1] = 0.0
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return {
+                operation: {
+                    name: {"calls": calls, "total_time": total_time}
+                    for name, (calls, total_time) in stats.items()
+                    if calls
+                }
+                for operation, stats in self._stats.items()
+            }
@@ -0,0 +1,32 @@
+from typing import (
+    Any,
+    List,
+)
+from weakref import WeakSet
+
+import sqlalchemy.orm
+
+serializers: "WeakSet[Any]" = WeakSet()
+
+
+def register(serializer_class: Any) -> None:
+    serializers.add(serializer_class)
+
+
+def get_serializers() -> List[Any]:
+    return [
+        serializer_class
+        for serializer_class in list(serializers)
+        if hasattr(getattr(serializer_class, "Meta", None), "model")
+    ]
+
+
+def compile_all(configure: bool = True) -> int:
+    if configure:
+        sqlalchemy.orm.configure_mappers()
+
+    serializer_classes = get_serializers()
+    for serializer_class in serializer_classes:
+        serializer_class.warmup()
+
+    return len(serializer_classes)
@@ -0,0 +1,214 @@
+import enum
+import functools
+import keyword
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import sqlalchemy
+
+ATTRIBUTE = "attribute"
+ENUM = "enum"
+METHOD = "method"
+NESTED = "nested"
+GENERIC = "generic"
+
+
+class SchemaField(NamedTuple):
+    name: str
+    type: Any
+    required: bool
+    validator: Any
+    kind: str
+
+
+class FieldMap(Mapping):
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: Tuple[SchemaField, ...], index: Dict[str, int]):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, name: str) -> SchemaField:
+        return self.table[self.index[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def get_fingerprint(meta) -> Tuple[Any, Any, Any]:
+    fields = getattr(meta, "fields", None)
+    return (
+        meta.model,
+        tuple(fields) if fields is not None else None,
+        tuple(getattr(meta, "except_fields", ["id"])),
+    )
+
+
+def get_enum_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    return value
+
+
+def get_field_expressions(
+    fields: Mapping[str, SchemaField],
+) -> Tuple[Tuple[str, ...], List[str]]:
+    dynamic_fields = []
+    expressions = []
+    for key, field in fields.items():
+        if field.kind in (ATTRIBUTE, ENUM):
+            if key.isidentifier() and not keyword.iskeyword(key):
+                expression = f"instance.{key}"
+            else:
+                expression = f"getattr(instance, {key!r})"
+
+            if field.kind == ENUM:
+                expression = f"get_enum_value({expression})"
+        else:
+            expression = f"getter_{len(dynamic_fields)}(instance)"
+            dynamic_fields.append(key)
+
+        expressions.append(expression)
+
+    return tuple(dynamic_fields), expressions
+
+
+def compile_factory(
+    dynamic_fields: Tuple[str, ...], result: str
+) -> Callable[..., Callable[[Any], Any]]:
+    arguments = ", ".join(f"getter_{i}" for i in range(len(dynamic_fields)))
+    source = (
+        f"def factory({arguments}):\n"
+        f"    def serialize(instance):\n"
+        f"        return {result}\n"
+        f"    return serialize\n"
+    )
+
+    namespace = {"get_enum_value": get_enum_value}
+    exec(compile(source, "<alcherializer>", "exec"), namespace)
+
+    return namespace["factory"]
+
+
+def parse_field_paths(
+    paths: Tuple[str, ...],
+) -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]]]:
+    names = []
+    children: Dict[str, List[str]] = {}
+    for path in paths:
+        name, _, child_path = path.partition(".")
+        if child_path:
+            children.setdefault(name, []).append(child_path)
+        else:
+            names.append(name)
+
+    return (
+        tuple(names),
+        {name: tuple(child_paths) for name, child_paths in children.items()},
+    )
+
+
+class Schema:
+    def __init__(
+        self,
+        serializer_class,
+        table: Tuple[SchemaField, ...] = None,
+        children: Dict[str, Tuple[Any, Tuple[str, ...]]] = None,
+    ):
+        self.serializer_class = serializer_class
+        self.fingerprint = get_fingerprint(serializer_class.Meta)
+        if table is None:
+            table = tuple(
+                SchemaField(name=key, **field)
+                for key, field in serializer_class._get_fields().items()
+            )
+
+        self.table: Tuple[SchemaField, ...] = table
+        self.index: Dict[str, int] = {
+            field.name: position for position, field in enumerate(self.table)
+        }
+        self.fields = FieldMap(self.table, self.index)
+        self.children: Dict[str, Tuple[Any, Tuple[str, ...]]] = children or {}
+        self.is_projection = children is not None
+
+        self.dynamic_fields, expressions = get_field_expressions(self.fields)
+        self.has_nested_fields = any(
+            field.kind == NESTED for field in self.table
+        )
+
+        items = ", ".join(
+            f"{key!r}: {expression}"
+            for key, expression in zip(self.fields, expressions)
+        )
+        self.to_dict_factory = compile_factory(
+            self.dynamic_fields, f"{{{items}}}"
+        )
+
+        mapper = sqlalchemy.inspect(serializer_class.Meta.model, raiseerr=False)
+        self.primary_keys: Tuple[str, ...] = (
+            tuple(
+                mapper.get_property_by_column(column).key
+                for column in mapper.primary_key
+            )
+            if mapper is not None
+            else ()
+        )
+
+        except_fields = getattr(serializer_class.Meta, "except_fields", ["id"])
+        self.validators: Tuple[Tuple[str, Any], ...] = tuple(
+            (key, field.validator)
+            for key, field in self.fields.items()
+            if key not in except_fields
+        )
+        self.validator_index: Dict[str, Any] = dict(self.validators)
+
+    def is_stale(self, meta) -> bool:
+        return get_fingerprint(meta) != self.fingerprint
+
+
+@functools.lru_cache(maxsize=256)
+def get_projection(
+    schema: Schema,
+    fields: Optional[Tuple[str, ...]],
+    exclude: Tuple[str, ...],
+) -> Schema:
+    children: Dict[str, Tuple[Any, Tuple[str, ...]]] = {}
+
+    table = schema.table
+    if fields is not None:
+        names, child_fields = parse_field_paths(fields)
+        table = tuple(
+            field
+            for field in table
+            if field.name in names or field.name in child_fields
+        )
+        for name, paths in child_fields.items():
+            children[name] = (paths, ())
+
+    excluded_names, child_exclude = parse_field_paths(exclude)
+    table = tuple(field for field in table if field.name not in excluded_names)
+    for name, paths in child_exclude.items():
+        children[name] = (children.get(name, (None,))[0], paths)
+
+    return Schema(
+        schema.serializer_class,
+        table,
+        {
+            name: projection
+            for name, projection in children.items()
+            if name in schema.index and schema.fields[name].kind == NESTED
+        },
+    )
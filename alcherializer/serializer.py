@@ -1,78 +1,780 @@
+import asyncio
+import contextlib
+import copy
 import enum
+import hashlib
+import inspect
+import io
+import operator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import repeat
+from types import SimpleNamespace
 from typing import (
     Any,
+    AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
 )
 
 import sqlalchemy
 from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy.orm import (
+    ColumnProperty,
+    RelationshipProperty,
+    joinedload,
+    selectinload,
+)
+
+from alcherializer import (
+    encoders,
+    fields,
+    registry,
+    schema as schema_kinds,
+)
+from alcherializer.cache import BaseCache
+from alcherializer.exceptions import (
+    InvalidDataException,
+    MalformedMetaClassException,
+)
+from alcherializer.instrumentation import (
+    IS_VALID,
+    Profiler,
+)
+from alcherializer.schema import (
+    Schema,
+    get_projection,
+)
+from alcherializer.utils import (
+    IdentityMemo,
+    achunked,
+    chunked,
+    memoize,
+    memoize_many,
+    resolve_awaitables,
+)
+
+
+def serialize_rows(
+    serializer_class: type,
+    context: Dict[str, Any],
+    fields: Optional[Tuple[str, ...]],
+    columns: Optional[Tuple[str, ...]],
+    rows: List[Any],
+) -> List[Dict[str, Any]]:
+    if columns is not None:
+        rows = [SimpleNamespace(**dict(zip(columns, row))) for row in rows]
+
+    return serializer_class(
+        rows, many=True, context=context, fields=fields
+    ).data
+
+
+class NestedGetter:
+    def __init__(
+        self,
+        parent: "Serializer",
+        key: str,
+        serializer: "Serializer",
+        memo: IdentityMemo,
+    ):
+        self.parent = parent
+        self.key = key
+        self.serializer = serializer
+        self.memo = memo
+        self.child_memo = memo.descend()
+        self.is_too_deep = self.child_memo.is_too_deep()
+        self.to_dicts: Optional[Callable[[List[Any]], List[Any]]] = None
+        self.get_reference: Optional[Callable[[Any], Dict[str, Any]]] = None
+        self.namespace: Any = None
+
+    def __call__(self, instance: Any) -> Any:
+        value = getattr(instance, self.key)
+        if isinstance(value, list):
+            if not value or not isinstance(value[0].__class__, DeclarativeMeta):
+                return value
+        elif not isinstance(value.__class__, DeclarativeMeta):
+            return value
+
+        if self.to_dicts is None:
+            self.compile()
+
+        if isinstance(value, list):
+            return self.serialize_related_many(value)
+
+        return self.serialize_related(value)
+
+    def compile(self) -> None:
+        child = self.parent._get_child(self.serializer, self.key)
+        self.to_dicts = child._get_to_dicts(self.child_memo)
+        self.get_reference = child._get_reference_function()
+        self.namespace = child.schema
+
+    def serialize_related(self, value: Any) -> Any:
+        if self.is_too_deep:
+            return self.get_reference(value)
+
+        memo = self.memo
+        memo_key = (self.namespace, id(value))
+        entry = memo.rows.get(memo_key)
+        if entry is not None:
+            return self.resolve(value, entry[1])
+
+        in_progress = memo.in_progress
+        if memo_key in in_progress:
+            return self.resolve(value, None)
+
+        cycles = memo.count_cycles()
+        in_progress.add(memo_key)
+        try:
+            row = self.to_dicts([value])[0]
+        finally:
+            in_progress.discard(memo_key)
+
+        # Rows holding references to a cycle depend on their ancestors
+        if memo.count_cycles() == cycles:
+            memo.set(memo_key, value, row)
+
+        return self.resolve(value, row)
+
+    def serialize_related_many(self, values: List[Any]) -> List[Any]:
+        if self.is_too_deep:
+            return [self.get_reference(value) for value in values]
+
+        memo = self.memo
+        rows = memo.rows
+        in_progress = memo.in_progress
+
+        keys = [(self.namespace, id(value)) for value in values]
+        known_rows = {}
+        pending = {}
+        for memo_key, value in zip(keys, values):
+            entry = rows.get(memo_key)
+            if entry is not None:
+                known_rows[memo_key] = entry[1]
+            elif memo_key not in in_progress:
+                pending[memo_key] = value
+
+        if pending:
+            cycles = memo.count_cycles()
+            in_progress.update(pending)
+            try:
+                computed_rows = dict(
+                    zip(pending, self.to_dicts(list(pending.values())))
+                )
+            finally:
+                in_progress.difference_update(pending)
+
+            if memo.count_cycles() == cycles:
+                for memo_key, row in computed_rows.items():
+                    memo.set(memo_key, pending[memo_key], row)
 
-from alcherializer import fields
-from alcherializer.exceptions import MalformedMetaClassException
+            known_rows.update(computed_rows)
+
+        return [
+            self.resolve(value, known_rows.get(memo_key))
+            for memo_key, value in zip(keys, values)
+        ]
+
+    def resolve(self, value: Any, row: Optional[Dict[str, Any]]) -> Any:
+        if row is None:
+            # Already being serialized up the tree, so it's a cycle
+            self.memo.mark_cycle()
+            return self.get_reference(value)
+
+        included = self.memo.included
+        if included is not None:
+            reference = self.get_reference(value)
+            if reference["id"] is not None:
+                included.setdefault(reference["type"], {})[
+                    reference["id"]
+                ] = row
+                return reference
+
+        return row
 
 
 class Serializer:
+    __slots__ = (
+        "meta",
+        "_resolved_schema",
+        "_resolved_fields",
+        "instance",
+        "many",
+        "partial",
+        "context",
+        "initial_data",
+        "errors",
+        "validated_data",
+        "profiler",
+        "_validated",
+        "__dict__",
+    )
+
+    _schema: Optional[Schema] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._schema = None
+        registry.register(cls)
+
     def __init__(self, instance=None, data=None, **kwargs):
         if not hasattr(self, "Meta") or not hasattr(self.Meta, "model"):
             raise MalformedMetaClassException("Serializer bad definition")
 
         self.meta = getattr(self, "Meta")
-
-        self.errors = {}
-        self.fields = self._get_fields()
         self.instance = instance
-        self.initial_data = {} if not data else data
         self.many = kwargs.get("many", False)
         self.partial = kwargs.get("partial", False)
         self.context = kwargs.get("context", {})
-        self.validated_data = {}
+        self.initial_data = data if data else ([] if self.many else {})
+        self.profiler: Optional[Profiler] = kwargs.get("profiler")
+        self._resolved_schema: Optional[Schema] = None
+        self._resolved_fields: Optional[Mapping[str, Any]] = None
+        self.clear()
+
+        fields = kwargs.get("fields")
+        exclude = kwargs.get("exclude")
+        if fields is not None or exclude:
+            self._project(fields, exclude)
+
+    @property
+    def schema(self) -> Schema:
+        if self._resolved_schema is None:
+            self._set_schema(self.get_schema())
+
+        return self._resolved_schema
+
+    @property
+    def fields(self) -> Mapping[str, Any]:
+        if self._resolved_fields is None:
+            self._set_schema(self.get_schema())
+
+        return self._resolved_fields
 
     @property
     def data(self) -> Dict[str, Any]:
-        instances = self.instance if self.many else [self.instance]
+        to_dicts = self._get_to_dicts()
+        if self.many:
+            return to_dicts(self.instance)
+
+        return to_dicts([self.instance])[0]
+
+    def normalized_data(self) -> Dict[str, Any]:
+        included = {}
+        to_dicts = self._get_to_dicts(self._get_memo(included))
+        items = to_dicts(self.instance if self.many else [self.instance])
+
+        return {"items": items, "included": included}
+
+    def iter_data(
+        self, instances: Iterable = None, chunk_size: int = None
+    ) -> Iterator[Any]:
+        if instances is None:
+            instances = self.instance if self.many else [self.instance]
+
+        to_dicts = self._get_to_dicts()
+        if not chunk_size:
+            for instance in instances:
+                yield to_dicts([instance])[0]
+
+            return
 
-        results = []
-        for instance in instances:
-            obj_dict = {}
-            for key in self.fields.keys():
-                obj_dict[key] = self._get_instance_field_value(instance, key)
+        for chunk in chunked(instances, chunk_size):
+            yield to_dicts(chunk)
 
-            results.append(obj_dict)
+    async def adata(self, concurrency: int = 10) -> Any:
+        results = [
+            row async for row in self.aiter_data(concurrency=concurrency)
+        ]
 
         return results if self.many else results[0]
 
-    def clear(self) -> None:
-        self.errors = {}
-        self.validated_data = {}
+    async def aiter_data(
+        self,
+        instances: Any = None,
+        chunk_size: int = 100,
+        concurrency: int = 10,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if instances is None:
+            instances = self.instance if self.many else [self.instance]
 
-    def is_valid(self) -> bool:
-        for key, field in self.fields.items():
-            if key in getattr(self.meta, "except_fields", ["id"]):
+        to_dicts = self._get_to_dicts()
+        semaphore = asyncio.Semaphore(concurrency)
+        async for chunk in achunked(instances, chunk_size):
+            rows = to_dicts(chunk)
+            await resolve_awaitables(rows, semaphore)
+
+            for row in rows:
+                yield row
+
+    def data_parallel(
+        self, executor: Executor = None, chunk_size: int = 1000
+    ) -> Any:
+        if executor is None:
+            with ThreadPoolExecutor() as executor:
+                return self.data_parallel(executor, chunk_size)
+
+        instances = self.instance if self.many else [self.instance]
+        if isinstance(executor, ProcessPoolExecutor):
+            chunks = self._map_on_processes(executor, instances, chunk_size)
+        else:
+            chunks = executor.map(
+                lambda chunk: self._get_to_dicts()(chunk),
+                chunked(instances, chunk_size),
+            )
+
+        results = [row for chunk in chunks for row in chunk]
+
+        return results if self.many else results[0]
+
+    def _map_on_processes(
+        self, executor: Executor, instances: Iterable, chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        if self.schema.has_nested_fields:
+            raise TypeError(
+                "Related serializers can't be serialized on a process pool, "
+                "use a thread pool"
+            )
+
+        instances = list(instances)
+        columns = None
+        chunks = chunked(instances, chunk_size)
+        if instances and isinstance(instances[0].__class__, DeclarativeMeta):
+            # Model instances are bound to their session, so their columns
+            # are read here and workers get plain rows
+            mapper = sqlalchemy.inspect(self.meta.model)
+            columns = tuple(attribute.key for attribute in mapper.column_attrs)
+            get_values = operator.attrgetter(*columns)
+            if len(columns) == 1:
+                chunks = (
+                    [(get_values(instance),) for instance in chunk]
+                    for chunk in chunks
+                )
+            else:
+                chunks = (
+                    [get_values(instance) for instance in chunk]
+                    for chunk in chunks
+                )
+
+        return executor.map(
+            serialize_rows,
+            repeat(self.__class__),
+            repeat(self.context),
+            repeat(tuple(self.fields) if self.schema.is_projection else None),
+            repeat(columns),
+            chunks,
+        )
+
+    def changed_data(self) -> Any:
+        get_changes = self._get_changes_function()
+        if self.many:
+            return [get_changes(instance) for instance in self.instance]
+
+        return get_changes(self.instance)
+
+    def to_json(self) -> str:
+        return encoders.dumps(self.data).decode()
+
+    def write_ndjson(
+        self, fp: Any, instances: Iterable = None, chunk_size: int = 1000
+    ) -> None:
+        binary = not isinstance(fp, io.TextIOBase)
+        for chunk in self.iter_data(instances, chunk_size=chunk_size):
+            payload = b"".join(encoders.dumps(row) + b"\n" for row in chunk)
+            fp.write(payload if binary else payload.decode())
+
+    @contextlib.contextmanager
+    def profile(
+        self,
+        profiler: Profiler = None,
+        on_span: Callable[[Dict[str, Any]], None] = None,
+    ) -> Iterator[Profiler]:
+        if profiler is None:
+            profiler = Profiler(on_span)
+
+        previous_profiler = self.profiler
+        self.profiler = profiler
+        try:
+            yield profiler
+        finally:
+            self.profiler = previous_profiler
+
+    @classmethod
+    def get_schema(cls) -> Schema:
+        schema = cls._schema
+        if schema is None or schema.is_stale(cls.Meta):
+            schema = cls._schema = Schema(cls)
+
+        return schema
+
+    @classmethod
+    def warmup(cls, _path: Tuple[type, ...] = ()) -> Schema:
+        schema = cls.get_schema()
+
+        path = _path + (cls,)
+        for field in schema.table:
+            serializer_class = field.validator.__class__
+            if (
+                field.kind == schema_kinds.NESTED
+                and serializer_class not in path
+            ):
+                serializer_class.warmup(path)
+
+        return schema
+
+    @classmethod
+    def invalidate_schema(cls) -> None:
+        cls._schema = None
+
+    @classmethod
+    def get_cache_key(cls, instance: Any) -> Optional[str]:
+        return cls._get_cache_key_function()(instance)
+
+    @classmethod
+    def invalidate_cache(cls, instance: Any) -> None:
+        key = cls.get_cache_key(instance)
+        if key is not None:
+            cls.Meta.cache.delete(key)
+
+    @classmethod
+    def _get_cache_key_function(cls) -> Callable[[Any], Optional[str]]:
+        schema = cls.get_schema()
+        primary_keys = schema.primary_keys
+        version_field = getattr(cls.Meta, "cache_version", None)
+        # Entries written with other fields, like before a deploy, are misses
+        fields_digest = hashlib.sha1(
+            ",".join(schema.fields).encode()
+        ).hexdigest()[:8]
+        prefix = (
+            f"{cls.Meta.model.__module__}.{cls.Meta.model.__qualname__}:"
+            f"{cls.__module__}.{cls.__qualname__}:{fields_digest}"
+        )
+
+        def get_cache_key(instance: Any) -> Optional[str]:
+            identity = [getattr(instance, key, None) for key in primary_keys]
+            if not identity or None in identity:
+                return None
+
+            version = (
+                getattr(instance, version_field, None)
+                if version_field
+                else None
+            )
+
+            return f"{prefix}:{':'.join(map(str, identity))}:{version}"
+
+        return get_cache_key
+
+    @classmethod
+    def eager_options(cls, _path: Tuple[type, ...] = ()) -> List[Any]:
+        path = _path + (cls,)
+
+        options = []
+        for key, field in cls.get_schema().fields.items():
+            if field.kind != schema_kinds.NESTED:
                 continue
 
-            value = self._get_value(key)
-            valid, errors = field.get("validator").run_validator(value)
-            if not valid:
-                self.errors[key] = errors
+            attribute = getattr(cls.Meta.model, key, None)
+            if not isinstance(
+                getattr(attribute, "property", None), RelationshipProperty
+            ):
                 continue
 
-            self.validated_data[key] = value
+            if attribute.property.uselist:
+                loader = selectinload(attribute)
+            else:
+                loader = joinedload(attribute)
+
+            serializer_class = field.validator.__class__
+            if serializer_class not in path:
+                child_options = serializer_class.eager_options(path)
+                if child_options:
+                    loader = loader.options(*child_options)
+
+            options.append(loader)
+
+        return options
+
+    @classmethod
+    def eager_load(cls, query: Any) -> Any:
+        return query.options(*cls.eager_options())
+
+    @classmethod
+    def projection_columns(cls) -> Optional[List[Any]]:
+        columns = []
+        for key, field in cls.get_schema().fields.items():
+            if field.kind not in (schema_kinds.ATTRIBUTE, schema_kinds.ENUM):
+                return None
+
+            attribute = getattr(cls.Meta.model, key, None)
+            if not isinstance(
+                getattr(attribute, "property", None), ColumnProperty
+            ):
+                return None
+
+            columns.append(attribute)
+
+        return columns
+
+    @classmethod
+    def project(cls, query: Any) -> Any:
+        columns = cls.projection_columns()
+        if columns is None:
+            return query
+
+        if hasattr(query, "with_entities"):
+            return query.with_entities(*columns)
+
+        return query.with_only_columns(columns)
+
+    def clear(self) -> None:
+        self.errors = [] if self.many else {}
+        self.validated_data = [] if self.many else {}
+        self._validated = False
+
+    def is_valid(self, fail_fast: bool = False, max_errors: int = None) -> bool:
+        if fail_fast:
+            max_errors = 1
+
+        self._validated = True
+        if self.many:
+            if max_errors is None:
+                self.errors, self.validated_data = self._validate_many(
+                    self.initial_data
+                )
+            else:
+                self.errors, self.validated_data = self._validate_rows(
+                    self.initial_data, max_errors
+                )
+
+            return self._has_errors()
+
+        errors, validated_data = self._validate_data(
+            self.initial_data, max_errors
+        )
+        self.errors.update(errors)
+        self.validated_data.update(validated_data)
 
         return self._has_errors()
 
-    def _get_value(self, key: str) -> Any:
-        return self.initial_data.get(key)
+    def save(self, session: Any) -> Any:
+        if self.many:
+            raise InvalidDataException("Use save_many to save many payloads")
+
+        self._check_validated_data()
+
+        values = self._get_mappings([self.validated_data])[0]
+        instance = self.instance
+        if instance is None:
+            instance = self.instance = self.meta.model(**values)
+        else:
+            for key, value in values.items():
+                setattr(instance, key, value)
+
+        session.add(instance)
+
+        return instance
+
+    def save_many(
+        self,
+        session: Any,
+        batch_size: int = 1000,
+        return_defaults: bool = False,
+    ) -> Optional[List[Any]]:
+        if not self.many:
+            raise InvalidDataException("Use save to save a single payload")
+
+        self._check_validated_data()
+
+        mappings = self._get_mappings(self.validated_data)
+        for chunk in chunked(mappings, batch_size):
+            session.bulk_insert_mappings(
+                self.meta.model, chunk, return_defaults=return_defaults
+            )
+
+        if not return_defaults:
+            return None
+
+        primary_keys = self.schema.primary_keys
+        if len(primary_keys) == 1:
+            return [mapping.get(primary_keys[0]) for mapping in mappings]
+
+        return [
+            tuple(mapping.get(key) for key in primary_keys)
+            for mapping in mappings
+        ]
+
+    def _check_validated_data(self) -> None:
+        if not self._validated:
+            raise InvalidDataException("is_valid must be called before saving")
+
+        if not self._has_errors():
+            raise InvalidDataException("Can't save invalid data")
+
+    def _get_mappings(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Only mapped columns are saved, method fields have no attribute
+        columns = {
+            key
+            for key, field in self.fields.items()
+            if field.kind in (schema_kinds.ATTRIBUTE, schema_kinds.ENUM)
+        }
+        casts = {
+            key: validator.cast
+            for key, validator in self.schema.validator_index.items()
+        }
+
+        mappings = []
+        for row in rows:
+            mapping = {}
+            for key, value in row.items():
+                if key not in columns:
+                    continue
+
+                if value is not None and key in casts:
+                    value = casts[key](value)
+
+                mapping[key] = value
+
+            mappings.append(mapping)
+
+        return mappings
+
+    def _validate_data(
+        self,
+        data: Dict[str, Any],
+        max_errors: int = None,
+        validators: List[Tuple[str, Callable[[Any], Any]]] = None,
+    ) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+        if validators is None:
+            validators = self._get_validators(
+                "run_validator", data if self.partial else None
+            )
+
+        errors = {}
+        validated_data = {}
+        for key, run_validator in validators:
+            value = data.get(key)
+            valid, field_errors = run_validator(value)
+            if not valid:
+                errors[key] = field_errors
+                if max_errors is not None and len(errors) >= max_errors:
+                    break
+
+                continue
+
+            validated_data[key] = value
+
+        return errors, validated_data
+
+    def _validate_rows(
+        self, rows: List[Dict[str, Any]], max_errors: int
+    ) -> Tuple[List[Dict[str, List[str]]], List[Dict[str, Any]]]:
+        errors = [{} for _ in rows]
+        validated_data = [{} for _ in rows]
+
+        validators = None
+        if not self.partial:
+            validators = self._get_validators("run_validator")
+
+        for position, row in enumerate(rows):
+            errors[position], validated_data[position] = self._validate_data(
+                row, max_errors, validators
+            )
+
+            max_errors -= len(errors[position])
+            if max_errors <= 0:
+                break
+
+        return errors, validated_data
+
+    def _validate_many(
+        self, rows: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, List[str]]], List[Dict[str, Any]]]:
+        errors = [{} for _ in rows]
+        validated_data = [{} for _ in rows]
+
+        keys = None
+        if self.partial:
+            keys = dict.fromkeys(key for row in rows for key in row)
+
+        for key, run_validator in self._get_validators(
+            "run_column_validator", keys
+        ):
+            if keys is None:
+                positions = range(len(rows))
+                column = [row.get(key) for row in rows]
+            else:
+                positions = [
+                    position for position, row in enumerate(rows) if key in row
+                ]
+                column = [rows[position][key] for position in positions]
+
+            mask, column_errors = run_validator(column)
+
+            for index, field_errors in column_errors.items():
+                errors[positions[index]][key] = field_errors
+
+            for position, valid, value in zip(positions, mask, column):
+                if valid:
+                    validated_data[position][key] = value
+
+        return errors, validated_data
+
+    def _get_validators(
+        self, method_name: str, keys: Iterable[str] = None
+    ) -> List[Tuple[str, Callable[[Any], Any]]]:
+        validators = self.schema.validators
+        if keys is not None:
+            validator_index = self.schema.validator_index
+            validators = [
+                (key, validator_index[key])
+                for key in keys
+                if key in validator_index
+            ]
+
+        profiler = self.profiler
+        if profiler is None:
+            return [
+                (key, getattr(validator, method_name))
+                for key, validator in validators
+            ]
+
+        return [
+            (
+                key,
+                profiler.timed(
+                    key,
+                    getattr(validator.profiled(profiler, key), method_name),
+                    IS_VALID,
+                ),
+            )
+            for key, validator in validators
+        ]
 
     def _has_errors(self) -> bool:
+        if self.many:
+            return not any(self.errors)
+
         return len(self.errors.keys()) <= 0
 
-    def _get_fields(self) -> Dict[str, Any]:
+    @classmethod
+    def _get_fields(cls) -> Dict[str, Any]:
         required_fields = []
-        if hasattr(self.meta, "fields"):
-            required_fields = self.meta.fields
+        if hasattr(cls.Meta, "fields"):
+            required_fields = cls.Meta.fields
 
         columns = {}
-        for key, value in self.meta.model.__dict__.items():
+        for key, value in cls.Meta.model.__dict__.items():
             if key.startswith("_"):
                 continue
 
@@ -84,68 +786,420 @@ class Serializer:
                 "required": value.nullable is False
                 if hasattr(value, "nullable")
                 else False,
-                "validator": self._get_field_validator(key, value),
+                "validator": cls._get_field_validator(key, value),
             }
 
         for field in required_fields:
             if field in columns:
                 continue
 
-            if not hasattr(self, field):
+            if cls._get_declared_field(field) is None:
                 continue
 
             columns[field] = {
-                "type": getattr(self, field),
+                "type": getattr(cls, field),
                 "required": False,
-                "validator": self._get_field_validator(field, field),
+                "validator": cls._get_field_validator(field, field),
             }
 
+        for field in columns.values():
+            field["kind"] = cls._get_field_kind(field)
+
         return columns
 
-    def _get_field_validator(self, key: str, field):
-        if hasattr(self, key):
-            validator = getattr(self, key)
+    @classmethod
+    def _get_declared_field(cls, key: str) -> Any:
+        # Methods and slots of the serializer may share a column's name
+        value = getattr(cls, key, None)
+        if isinstance(value, (fields.BaseField, Serializer)):
+            return value
+
+        return None
+
+    @classmethod
+    def _get_field_validator(cls, key: str, field):
+        validator = cls._get_declared_field(key)
+        if validator is not None:
             validator.name = key
             validator.field = field
 
             return validator
 
-        if isinstance(field.type, sqlalchemy.String):
-            return fields.StringField(key, field)
+        return fields.get_field_class(field.type)(key, field)
+
+    @classmethod
+    def _get_field_kind(cls, field: Dict[str, Any]) -> str:
+        if isinstance(field["type"], fields.MethodField):
+            return schema_kinds.METHOD
+
+        if isinstance(field["validator"], Serializer):
+            return schema_kinds.NESTED
+
+        if isinstance(field["type"], sqlalchemy.types.TypeEngine):
+            if isinstance(
+                field["type"],
+                (sqlalchemy.Enum, sqlalchemy.types.TypeDecorator),
+            ):
+                return schema_kinds.ENUM
+
+            return schema_kinds.ATTRIBUTE
+
+        return schema_kinds.GENERIC
+
+    def _get_to_dicts(
+        self, memo: IdentityMemo = None
+    ) -> Callable[[List[Any]], List[Dict[str, Any]]]:
+        is_root = memo is None
+        if is_root:
+            memo = self._get_memo()
+
+        track = is_root and self.schema.has_nested_fields
+
+        to_dict = self._get_to_dict(memo)
+        if track:
+            to_dict = self._track_in_progress(to_dict, memo)
+
+        to_dicts = self._get_batch_serializer(to_dict)
+
+        cache = getattr(self.meta, "cache", None)
+        if cache is not None and not self.schema.is_projection:
+            to_dicts = self._get_cached_serializer(to_dicts, cache, memo, track)
+
+        return to_dicts
+
+    def _track_in_progress(
+        self, serialize: Callable[..., Any], memo: IdentityMemo
+    ) -> Callable[..., Any]:
+        namespace = self.schema
+        in_progress = memo.in_progress
+
+        # Only the instance being serialized is an ancestor of its nested
+        # values, its siblings in the batch aren't
+        def serialize_tracked(instance: Any, *args) -> Any:
+            key = (namespace, id(instance))
+            in_progress.add(key)
+            try:
+                return serialize(instance, *args)
+            finally:
+                in_progress.discard(key)
+
+        return serialize_tracked
+
+    def _get_memo(
+        self, included: Dict[str, Dict[str, Any]] = None
+    ) -> IdentityMemo:
+        return IdentityMemo(getattr(self.meta, "max_depth", None), included)
+
+    def _get_cached_serializer(
+        self,
+        to_dicts: Callable[[List[Any]], List[Dict[str, Any]]],
+        cache: BaseCache,
+        memo: IdentityMemo,
+        track: bool = False,
+    ) -> Callable[[List[Any]], List[Dict[str, Any]]]:
+        get_cache_key = self._get_cache_key_function()
+        nested_getters = {
+            key: self._get_field_getter(key, field, memo)
+            for key, field in self.fields.items()
+            if field.kind == schema_kinds.NESTED
+        }
+
+        cached_fields = [
+            key for key in self.fields if key not in nested_getters
+        ]
+
+        def get_cached_row(instance: Any, entry: Dict[str, Any]) -> Any:
+            return {
+                field: nested_getters[field](instance)
+                if field in nested_getters
+                else entry[field]
+                for field in self.fields
+            }
+
+        if track:
+            get_cached_row = self._track_in_progress(get_cached_row, memo)
+
+        def serialize_batch(instances: List[Any]) -> List[Dict[str, Any]]:
+            instances = list(instances)
+            keys = [get_cache_key(instance) for instance in instances]
+
+            cacheable_keys = [key for key in keys if key is not None]
+            entries = {}
+            if cacheable_keys:
+                entries = {
+                    key: entry
+                    for key, entry in zip(
+                        cacheable_keys, cache.lookup_many(cacheable_keys)
+                    )
+                    if entry is not None
+                    and all(field in entry for field in cached_fields)
+                }
+
+            computed_rows = iter(
+                to_dicts(
+                    [
+                        instance
+                        for instance, key in zip(instances, keys)
+                        if entries.get(key) is None
+                    ]
+                )
+            )
+
+            rows = []
+            new_entries = {}
+            for instance, key in zip(instances, keys):
+                entry = entries.get(key)
+                if entry is None:
+                    row = next(computed_rows)
+                    entry = {
+                        field: value
+                        for field, value in row.items()
+                        if field not in nested_getters
+                    }
+                    # Coroutines of async method fields can't be reused
+                    if key is not None and not any(
+                        inspect.isawaitable(value) for value in entry.values()
+                    ):
+                        new_entries[key] = entry
+                else:
+                    row = get_cached_row(instance, entry)
+
+                rows.append(row)
 
-        if isinstance(field.type, sqlalchemy.Integer):
-            return fields.IntegerField(key, field)
+            if new_entries:
+                cache.set_many(new_entries)
 
-        if isinstance(field.type, sqlalchemy.Boolean):
-            return fields.BooleanField(key, field)
+            return rows
 
-        return fields.BaseField(key, field)
+        return serialize_batch
+
+    def _get_batch_serializer(
+        self, serialize: Callable[[Any], Any]
+    ) -> Callable[[List[Any]], List[Any]]:
+        batch_getters = self._get_batch_getters()
+        if not batch_getters:
+            return lambda instances: [
+                serialize(instance) for instance in instances
+            ]
+
+        def serialize_batch(instances: List[Any]) -> List[Any]:
+            # Batch getters walk the instances again, so a query or a
+            # generator is read once
+            instances = list(instances)
+            rows = [serialize(instance) for instance in instances]
+
+            for key, getter in batch_getters:
+                for row, value in zip(rows, getter(instances)):
+                    row[key] = value
+
+            return rows
+
+        return serialize_batch
+
+    def _get_batch_getters(
+        self,
+    ) -> List[Tuple[str, Callable[[List[Any]], List[Any]]]]:
+        batch_getters = []
+        for key, field in self.fields.items():
+            if field.kind != schema_kinds.METHOD:
+                continue
+
+            getter = getattr(self, f"get_{key}_many", None)
+            if getter is None:
+                continue
+
+            memo_key = getattr(field.validator, "memo_key", None)
+            if memo_key is not None:
+                getter = memoize_many(getter, memo_key)
+
+            if self.profiler is not None:
+                getter = self.profiler.timed(key, getter)
+
+            batch_getters.append((key, getter))
+
+        return batch_getters
+
+    def _get_to_dict(
+        self, memo: IdentityMemo
+    ) -> Callable[[Any], Dict[str, Any]]:
+        if self.profiler is not None:
+            return self._get_profiled_to_dict(self.profiler, memo)
+
+        return self.schema.to_dict_factory(*self._get_dynamic_getters(memo))
+
+    def _get_profiled_to_dict(
+        self, profiler: Profiler, memo: IdentityMemo
+    ) -> Callable[[Any], Dict[str, Any]]:
+        getters = []
+        for key, field in self.fields.items():
+            getter = self._get_field_getter(key, field, memo)
+            if not (
+                field.kind == schema_kinds.METHOD
+                and hasattr(self, f"get_{key}_many")
+            ):
+                getter = profiler.timed(key, getter)
+
+            getters.append((key, getter))
+
+        return lambda instance: {
+            key: getter(instance) for key, getter in getters
+        }
+
+    def _get_dynamic_getters(
+        self, memo: IdentityMemo
+    ) -> List[Callable[[Any], Any]]:
+        return [
+            self._get_field_getter(key, self.fields[key], memo)
+            for key in self.schema.dynamic_fields
+        ]
+
+    def _get_field_getter(
+        self, key: str, field: Dict[str, Any], memo: IdentityMemo = None
+    ) -> Callable[[Any], Any]:
+        if field.kind == schema_kinds.METHOD:
+            if hasattr(self, f"get_{key}_many"):
+                return lambda instance: None
+
+            getter = getattr(self, f"get_{key}", lambda o: None)
+
+            memo_key = getattr(field.validator, "memo_key", None)
+            if memo_key is not None:
+                getter = memoize(getter, memo_key)
+
+            return getter
+
+        if field.kind == schema_kinds.NESTED:
+            return self._get_nested_getter(key, field.validator, memo)
+
+        return lambda instance: self._get_instance_field_value(instance, key)
+
+    def _get_nested_getter(
+        self, key: str, serializer: "Serializer", memo: IdentityMemo = None
+    ) -> Callable[[Any], Any]:
+        if memo is None:
+            memo = self._get_memo()
+
+        return NestedGetter(self, key, serializer, memo)
+
+    def _get_reference_function(self) -> Callable[[Any], Dict[str, Any]]:
+        primary_keys = self.schema.primary_keys
+        type_name = self.meta.model.__name__
+
+        def get_reference(instance: Any) -> Dict[str, Any]:
+            identity = [getattr(instance, key, None) for key in primary_keys]
+            if not identity or None in identity:
+                return {"type": type_name, "id": None}
+
+            return {"type": type_name, "id": ":".join(map(str, identity))}
+
+        return get_reference
+
+    def _get_changes_function(self) -> Callable[[Any], Dict[str, Any]]:
+        attribute_getters = []
+        nested_getters = []
+        for key, field in self.fields.items():
+            if field.kind in (schema_kinds.ATTRIBUTE, schema_kinds.ENUM):
+                attribute_getters.append(
+                    (key, self._get_field_getter(key, field))
+                )
+            elif field.kind == schema_kinds.NESTED:
+                nested_getters.append(
+                    (
+                        key,
+                        self._get_nested_getter(key, field.validator),
+                        self._get_nested_changes_getter(key, field.validator),
+                    )
+                )
+
+        def get_changes(instance: Any) -> Dict[str, Any]:
+            state = sqlalchemy.inspect(instance)
+            modified = state.committed_state
+
+            changes = {}
+            for key, getter in attribute_getters:
+                if key in modified and state.attrs[key].history.has_changes():
+                    changes[key] = getter(instance)
+
+            for key, getter, get_nested_changes in nested_getters:
+                if key in modified and state.attrs[key].history.has_changes():
+                    changes[key] = getter(instance)
+                    continue
+
+                nested_changes = get_nested_changes(state.dict.get(key))
+                if nested_changes:
+                    changes[key] = nested_changes
+
+            return changes
+
+        return get_changes
+
+    def _get_nested_changes_getter(
+        self, key: str, serializer: "Serializer"
+    ) -> Callable[[Any], Any]:
+        get_changes = None
+
+        def get_nested_changes(value: Any) -> Any:
+            nonlocal get_changes
+
+            if value is None:
+                return None
+
+            if get_changes is None:
+                get_changes = self._get_child(
+                    serializer, key
+                )._get_changes_function()
+
+            if isinstance(value, list):
+                changes = [get_changes(item) for item in value]
+                return changes if any(changes) else None
+
+            return get_changes(value)
+
+        return get_nested_changes
+
+    def _get_child(
+        self, serializer: "Serializer", key: str = None
+    ) -> "Serializer":
+        child = copy.copy(serializer)
+        child.instance = None
+        child.many = False
+        child.context = self.context
+        child.profiler = (
+            self.profiler.child(key or serializer.__class__.__name__)
+            if self.profiler is not None
+            else None
+        )
+
+        projection = self.schema.children.get(key)
+        if projection is not None:
+            child._project(*projection)
+
+        return child
+
+    def _project(
+        self, fields: Optional[Iterable[str]], exclude: Optional[Iterable[str]]
+    ) -> None:
+        self._set_schema(
+            get_projection(
+                self.schema,
+                tuple(fields) if fields is not None else None,
+                tuple(exclude or ()),
+            )
+        )
+
+    def _set_schema(self, schema: Schema) -> None:
+        self._resolved_schema = schema
+        self._resolved_fields = schema.fields
 
     def _get_instance_field_value(self, instance, field: str) -> Any:
-        if isinstance(self.fields[field].get("type"), fields.MethodField):
-            return getattr(self, f"get_{field}", lambda o: None)(instance)
+        if self.fields[field].kind in (
+            schema_kinds.METHOD,
+            schema_kinds.NESTED,
+        ):
+            return self._get_field_getter(field, self.fields[field])(instance)
 
         value = getattr(instance, field)
-        if isinstance(value.__class__, DeclarativeMeta):
-            serializer = self.fields[field]["validator"]
-            if isinstance(serializer, Serializer):
-                serializer.instance = value
-                serializer.context = self.context
-                return serializer.data
-
         if isinstance(value, enum.Enum):
             return value.value
 
-        if (
-            isinstance(value, list)
-            and len(value) > 0
-            and isinstance(value[0].__class__, DeclarativeMeta)
-        ):
-            serializer = self.fields[field]["validator"]
-            if isinstance(serializer, Serializer):
-                serializer.instance = value
-                serializer.many = True
-                serializer.context = self.context
-                return serializer.data
-
         return value
@@ -0,0 +1,199 @@
+import asyncio
+import copy
+import inspect
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+async def achunked(iterable: Any, size: int) -> AsyncIterator[List]:
+    if not hasattr(iterable, "__aiter__"):
+        for chunk in chunked(iterable, size):
+            yield chunk
+
+        return
+
+    chunk = []
+    async for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def collect_awaitables(
+    value: Any,
+    awaitables: List[Tuple[Any, Any, Awaitable]],
+    seen: Set[int] = None,
+) -> List[Tuple[Any, Any, Awaitable]]:
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return awaitables
+
+    # Rows of shared related objects are reached from every parent
+    if seen is None:
+        seen = set()
+    elif id(value) in seen:
+        return awaitables
+
+    seen.add(id(value))
+
+    for key, item in items:
+        if inspect.isawaitable(item):
+            awaitables.append((value, key, item))
+        else:
+            collect_awaitables(item, awaitables, seen)
+
+    return awaitables
+
+
+async def resolve_awaitables(value: Any, semaphore: asyncio.Semaphore) -> Any:
+    targets: Dict[int, Tuple[Awaitable, List[Tuple[Any, Any]]]] = {}
+    for container, key, awaitable in collect_awaitables(value, []):
+        targets.setdefault(id(awaitable), (awaitable, []))[1].append(
+            (container, key)
+        )
+
+    async def resolve(
+        awaitable: Awaitable, containers: List[Tuple[Any, Any]]
+    ) -> None:
+        async with semaphore:
+            result = await awaitable
+
+        for container, key in containers:
+            container[key] = result
+
+    await asyncio.gather(
+        *(
+            resolve(awaitable, containers)
+            for awaitable, containers in targets.values()
+        )
+    )
+
+    return value
+
+
+def memoize(
+    function: Callable[[Any], Any],
+    memo_key: Callable[[Any], Hashable],
+    max_size: int = 10000,
+) -> Callable[[Any], Any]:
+    memo = {}
+
+    def memoized(value: Any) -> Any:
+        key = memo_key(value)
+        if key in memo:
+            return memo[key]
+
+        # Bounded like IdentityMemo, so a long stream keeps flat memory
+        if len(memo) >= max_size:
+            memo.clear()
+
+        result = memo[key] = function(value)
+
+        return result
+
+    return memoized
+
+
+def memoize_many(
+    function: Callable[[List[Any]], List[Any]],
+    memo_key: Callable[[Any], Hashable],
+    max_size: int = 10000,
+) -> Callable[[List[Any]], List[Any]]:
+    memo = {}
+
+    def memoized(values: List[Any]) -> List[Any]:
+        keys = [memo_key(value) for value in values]
+
+        missing = {}
+        for key, value in zip(keys, values):
+            if key not in memo and key not in missing:
+                missing[key] = value
+
+        if not missing:
+            return [memo[key] for key in keys]
+
+        computed = dict(zip(missing, function(list(missing.values()))))
+        results = [
+            computed[key] if key in computed else memo[key] for key in keys
+        ]
+
+        if len(memo) + len(computed) > max_size:
+            memo.clear()
+
+        memo.update(computed)
+
+        return results
+
+    return memoized
+
+
+class IdentityMemo:
+    def __init__(
+        self,
+        max_depth: int = None,
+        included: Dict[str, Dict[str, Any]] = None,
+        max_size: int = 10000,
+    ):
+        self.max_depth = max_depth
+        self.included = included
+        self.max_size = max_size
+        self.depth = 0
+        self.rows: Dict[Tuple[Any, int], Tuple[Any, Any]] = {}
+        self.rows_by_depth = {0: self.rows}
+        self.in_progress: Set[Tuple[Any, int]] = set()
+        # A list, so the count is shared with descended memos
+        self.cycles = [0]
+
+    def descend(self) -> "IdentityMemo":
+        memo = copy.copy(self)
+        memo.depth += 1
+        if self.max_depth is not None:
+            # Rows are cut at max_depth, so they're only shared at one depth
+            memo.rows = self.rows_by_depth.setdefault(memo.depth, {})
+
+        return memo
+
+    def is_too_deep(self) -> bool:
+        return self.max_depth is not None and self.depth > self.max_depth
+
+    def mark_cycle(self) -> None:
+        self.cycles[0] += 1
+
+    def count_cycles(self) -> int:
+        return self.cycles[0]
+
+    def set(self, key: Tuple[Any, int], value: Any, row: Any) -> None:
+        if len(self.rows) >= self.max_size:
+            self.rows.clear()
+
+        # The value is kept alive so its id can't be reused by another object
+        self.rows[key] = (value, row)
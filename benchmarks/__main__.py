@@ -0,0 +1,136 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import sqlalchemy
+
+from alcherializer import fields
+from benchmarks import suite
+
+
+def get_revision() -> Any:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_metadata() -> Dict[str, Any]:
+    return {
+        "revision": get_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "numpy": fields.numpy is not None,
+    }
+
+
+def report(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['name']:<32} {result['size']:>9,} rows "
+        f"{result['seconds'] * 1000:>12.3f} ms "
+        f"{result['rows_per_second']:>14,.0f} rows/s",
+        file=sys.stderr,
+    )
+
+
+def report_comparisons(comparisons: List[Dict[str, Any]]) -> None:
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison["regression"] else ""
+        print(
+            f"{comparison['name']:<32} {comparison['size']:>9,} rows "
+            f"{comparison['ratio']:>8.2f}x{flag}",
+            file=sys.stderr,
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Runs the alcherializer benchmark suite",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="include batches of 1,000,000 rows",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        help="comma separated batch sizes, overrides --full",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        help="only run cases whose name contains this text",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=suite.REPEAT,
+        help="timing repetitions, the best one is kept (default: 3)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write the JSON results to this file instead of stdout",
+    )
+    parser.add_argument(
+        "--compare",
+        help="JSON results of a previous run to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown ratio reported as a regression (default: 0.1)",
+    )
+    arguments = parser.parse_args()
+
+    sizes = arguments.sizes or (
+        suite.FULL_SIZES if arguments.full else suite.DEFAULT_SIZES
+    )
+    output = {
+        "metadata": get_metadata(),
+        "results": suite.run(sizes, arguments.filter, arguments.repeat, report),
+    }
+
+    regressions = False
+    if arguments.compare:
+        with open(arguments.compare) as fp:
+            baseline = json.load(fp)
+
+        output["comparisons"] = suite.compare(
+            baseline["results"], output["results"], arguments.threshold
+        )
+        report_comparisons(output["comparisons"])
+        regressions = any(
+            comparison["regression"] for comparison in output["comparisons"]
+        )
+
+    if arguments.output:
+        with open(arguments.output, "w") as fp:
+            json.dump(output, fp, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
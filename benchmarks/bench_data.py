@@ -0,0 +1,83 @@
+import enum
+import timeit
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class User(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+    status = sqlalchemy.Column(sqlalchemy.Enum(Status))
+
+    __tablename__ = "user"
+
+
+class UserSerializer(Serializer):
+    display_name = fields.MethodField()
+
+    def get_display_name(self, user: User) -> str:
+        return user.name.title()
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "name",
+            "email",
+            "age",
+            "is_active",
+            "status",
+            "display_name",
+        ]
+
+
+def data_before(serializer: Serializer) -> list:
+    # Previous behaviour: every field of every row went through the
+    # generic dispatch
+    return [
+        {
+            key: serializer._get_instance_field_value(instance, key)
+            for key in serializer.fields.keys()
+        }
+        for instance in serializer.instance
+    ]
+
+
+def data_after(serializer: Serializer) -> list:
+    return serializer.data
+
+
+if __name__ == "__main__":
+    users = [
+        User(
+            id=i,
+            name=f"user {i}",
+            email=f"user{i}@example.com",
+            age=i % 90,
+            is_active=bool(i % 2),
+            status=Status.ACTIVE,
+        )
+        for i in range(10000)
+    ]
+    serializer = UserSerializer(users, many=True)
+    assert data_before(serializer) == data_after(serializer)
+
+    for name, func in (("before", data_before), ("after", data_after)):
+        seconds = min(
+            timeit.repeat(lambda: func(serializer), number=5, repeat=3)
+        )
+        print(f"{name}: {len(users) * 5 / seconds:,.0f} rows/s")
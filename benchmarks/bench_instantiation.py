@@ -0,0 +1,41 @@
+import timeit
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import Serializer
+
+
+class User(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+    __tablename__ = "user"
+
+
+class UserSerializer(Serializer):
+    class Meta:
+        model = User
+
+
+def per_request_setup_before() -> None:
+    # Previous behaviour: the model was introspected on every instantiation
+    UserSerializer._get_fields()
+    UserSerializer()
+
+
+def per_request_setup_after() -> None:
+    UserSerializer()
+
+
+if __name__ == "__main__":
+    number = 20000
+    for name, func in (
+        ("before", per_request_setup_before),
+        ("after", per_request_setup_after),
+    ):
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name}: {seconds / number * 1e6:.2f} us per serializer")
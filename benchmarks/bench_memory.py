@@ -0,0 +1,84 @@
+import gc
+import tracemalloc
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+from alcherializer.schema import Schema
+
+Base = declarative_base()
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+
+    __tablename__ = "user"
+
+
+class ManagerSerializer(Serializer):
+    class Meta:
+        model = Manager
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+    display_name = fields.MethodField()
+
+    def get_display_name(self, user: User) -> str:
+        return user.name.title()
+
+    class Meta:
+        model = User
+
+
+def measure(factory, count: int = 10000) -> float:
+    factory()
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    alive = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    )
+    del alive
+
+    return allocated / count
+
+
+if __name__ == "__main__":
+    print(f"UserSerializer: {measure(UserSerializer):.0f} bytes per instance")
+    print(
+        "StringField: "
+        f"{measure(lambda: fields.StringField('name', User.name)):.0f} "
+        "bytes per instance"
+    )
+    print(
+        "UserSerializer schema: "
+        f"{measure(lambda: Schema(UserSerializer), count=100):.0f} "
+        "bytes per class"
+    )
@@ -0,0 +1,85 @@
+import time
+import timeit
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+CURRENCIES = ["BRL", "EUR", "GBP", "JPY", "USD"]
+
+
+class Order(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    currency = sqlalchemy.Column(sqlalchemy.String(3), nullable=False)
+
+    __tablename__ = "order"
+
+
+def convert(currencies: list) -> list:
+    # Simulates a slow lookup, e.g. a call to a rates service
+    time.sleep(0.0001)
+    return [f"{currency}/USD" for currency in currencies]
+
+
+class OrderSerializer(Serializer):
+    rate = fields.MethodField()
+
+    def get_rate(self, order: Order) -> str:
+        return convert([order.currency])[0]
+
+    class Meta:
+        model = Order
+        fields = ["id", "rate"]
+
+
+class MemoizedOrderSerializer(OrderSerializer):
+    rate = fields.MethodField(memo_key=lambda order: order.currency)
+
+    class Meta:
+        model = Order
+        fields = ["id", "rate"]
+
+
+class BatchOrderSerializer(OrderSerializer):
+    def get_rate_many(self, orders: list) -> list:
+        return convert([order.currency for order in orders])
+
+    class Meta:
+        model = Order
+        fields = ["id", "rate"]
+
+
+class MemoizedBatchOrderSerializer(BatchOrderSerializer):
+    rate = fields.MethodField(memo_key=lambda order: order.currency)
+
+    class Meta:
+        model = Order
+        fields = ["id", "rate"]
+
+
+if __name__ == "__main__":
+    orders = [
+        Order(id=i, currency=CURRENCIES[i % len(CURRENCIES)])
+        for i in range(10000)
+    ]
+
+    for serializer_class in (
+        OrderSerializer,
+        MemoizedOrderSerializer,
+        BatchOrderSerializer,
+        MemoizedBatchOrderSerializer,
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: list(
+                    serializer_class().iter_data(orders, chunk_size=1000)
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(f"{serializer_class.__name__}: {seconds:.3f}s")
@@ -0,0 +1,83 @@
+import timeit
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+from alcherializer.utils import IdentityMemo
+
+Base = declarative_base()
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100))
+    email = sqlalchemy.Column(sqlalchemy.String(100))
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100))
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+
+    __tablename__ = "user"
+
+
+class ManagerSerializer(Serializer):
+    display_name = fields.MethodField()
+
+    def get_display_name(self, manager: Manager) -> str:
+        return f"{manager.name} <{manager.email}>"
+
+    class Meta:
+        model = Manager
+        fields = ["id", "name", "email", "display_name"]
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "manager"]
+
+
+if __name__ == "__main__":
+    managers = [
+        Manager(id=i, name=f"manager {i}", email=f"manager{i}@example.com")
+        for i in range(10)
+    ]
+    users = [
+        User(id=i, name=f"user {i}", manager=managers[i % 10])
+        for i in range(10000)
+    ]
+    serializer = UserSerializer(users, many=True)
+
+    def data() -> list:
+        return serializer.data
+
+    def normalized_data() -> dict:
+        return serializer.normalized_data()
+
+    # Previous behaviour: every related object was serialized again
+    with mock.patch.object(IdentityMemo, "set"):
+        before = data()
+        seconds = min(timeit.repeat(data, number=5, repeat=3))
+        print(f"before: {len(users) * 5 / seconds:,.0f} rows/s")
+
+    assert before == data()
+
+    for func in (data, normalized_data):
+        seconds = min(timeit.repeat(func, number=5, repeat=3))
+        print(f"{func.__name__}: {len(users) * 5 / seconds:,.0f} rows/s")
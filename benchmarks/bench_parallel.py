@@ -0,0 +1,78 @@
+import hashlib
+import os
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class User(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+    __tablename__ = "user"
+
+
+class UserSerializer(Serializer):
+    avatar = fields.MethodField()
+
+    def get_avatar(self, user: User) -> str:
+        digest = hashlib.sha256(user.email.encode())
+        for _ in range(20):
+            digest = hashlib.sha256(digest.digest())
+
+        return f"https://avatars.example.com/{digest.hexdigest()}"
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "email", "age", "is_active", "avatar"]
+
+
+def measure(serializer: Serializer, executor=None) -> float:
+    start = time.perf_counter()
+    if executor is None:
+        serializer.data
+    else:
+        serializer.data_parallel(executor, chunk_size=5000)
+
+    return len(serializer.instance) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    users = [
+        User(
+            id=i,
+            name=f"user {i}",
+            email=f"user{i}@example.com",
+            age=i % 90,
+            is_active=bool(i % 2),
+        )
+        for i in range(100000)
+    ]
+    serializer = UserSerializer(users, many=True)
+
+    print(f"data: {measure(serializer):,.0f} rows/s")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        for name, executor_class in (
+            ("threads", ThreadPoolExecutor),
+            ("processes", ProcessPoolExecutor),
+        ):
+            with executor_class(max_workers=workers) as executor:
+                rows_per_second = measure(serializer, executor)
+
+            print(
+                f"data_parallel {name} x{workers}: "
+                f"{rows_per_second:,.0f} rows/s"
+            )
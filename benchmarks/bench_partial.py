@@ -0,0 +1,40 @@
+import timeit
+
+from benchmarks.models import (
+    make_payloads,
+    make_schema,
+)
+
+WIDTH = 60
+
+ROWS = 1000
+
+
+if __name__ == "__main__":
+    _, _, serializer_class = make_schema(WIDTH, 0)
+    payload = {
+        key: value
+        for key, value in make_payloads(WIDTH, 1, True)[0].items()
+        if key in ("column_0", "column_1")
+    }
+    payloads = [payload] * ROWS
+
+    for partial in (False, True):
+        # Before, partial was ignored and every field was validated
+        def validate() -> None:
+            serializer_class(data=payload, partial=partial).is_valid()
+
+        def validate_many() -> None:
+            serializer_class(
+                data=payloads, many=True, partial=partial
+            ).is_valid()
+
+        name = "partial" if partial else "full"
+        seconds = min(timeit.repeat(validate, number=1000, repeat=3))
+        print(f"{name}, {WIDTH} columns: {seconds * 1000:.1f} us/payload")
+
+        seconds = min(timeit.repeat(validate_many, number=1, repeat=3))
+        print(
+            f"{name} many, {WIDTH} columns: "
+            f"{ROWS / seconds:,.0f} payloads/s"
+        )
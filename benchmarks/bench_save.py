@@ -0,0 +1,48 @@
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from benchmarks.models import (
+    make_payloads,
+    make_schema,
+)
+
+WIDTH = 10
+
+ROWS = 20000
+
+
+def add_per_row(session, models, serializer) -> None:
+    # Previous approach: build and add one instance at a time
+    for values in serializer._get_mappings(serializer.validated_data):
+        session.add(models[0](**values))
+
+
+def save_many(session, models, serializer) -> None:
+    serializer.save_many(session)
+
+
+def save_many_returning_primary_keys(session, models, serializer) -> None:
+    serializer.save_many(session, return_defaults=True)
+
+
+if __name__ == "__main__":
+    for func in (add_per_row, save_many, save_many_returning_primary_keys):
+        Base, models, serializer_class = make_schema(WIDTH, 0)
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = Session(bind=engine)
+
+        serializer = serializer_class(
+            data=make_payloads(WIDTH, ROWS, True), many=True
+        )
+        assert serializer.is_valid()
+
+        started = time.perf_counter()
+        func(session, models, serializer)
+        session.commit()
+        seconds = time.perf_counter() - started
+
+        assert session.query(models[0]).count() == ROWS
+        print(f"{func.__name__}: {ROWS / seconds:,.0f} rows/s")
@@ -0,0 +1,108 @@
+import time
+from typing import (
+    Any,
+    List,
+)
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    compile_all,
+)
+
+SERIALIZERS = 300
+
+
+def define_serializers(count: int, eager: bool) -> List[Any]:
+    Base = declarative_base()
+
+    serializer_classes = []
+    for i in range(count):
+        related_model = type(
+            f"Related{i}",
+            (Base,),
+            {
+                "__tablename__": f"related_{i}",
+                "id": sqlalchemy.Column(sqlalchemy.Integer, primary_key=True),
+                "name": sqlalchemy.Column(sqlalchemy.String(50)),
+            },
+        )
+        model = type(
+            f"Model{i}",
+            (Base,),
+            {
+                "__tablename__": f"model_{i}",
+                "id": sqlalchemy.Column(sqlalchemy.Integer, primary_key=True),
+                "name": sqlalchemy.Column(sqlalchemy.String(50)),
+                "age": sqlalchemy.Column(sqlalchemy.Integer),
+                "related_id": sqlalchemy.Column(
+                    sqlalchemy.Integer,
+                    sqlalchemy.ForeignKey(f"related_{i}.id"),
+                ),
+                "related": relationship(related_model),
+            },
+        )
+
+        related_serializer = type(
+            f"Related{i}Serializer",
+            (Serializer,),
+            {"Meta": type("Meta", (), {"model": related_model})},
+        )
+        serializer = type(
+            f"Model{i}Serializer",
+            (Serializer,),
+            {
+                "related": related_serializer(),
+                "Meta": type(
+                    "Meta",
+                    (),
+                    {
+                        "model": model,
+                        "fields": ["id", "name", "age", "related"],
+                    },
+                ),
+            },
+        )
+        if eager:
+            # Previous behaviour: declaring a related serializer compiled
+            # its schema at import time
+            related_serializer.get_schema()
+
+        serializer_classes.append((model, related_model, serializer))
+
+    return serializer_classes
+
+
+def first_requests(serializer_classes: List[Any]) -> None:
+    for model, related_model, serializer in serializer_classes:
+        serializer(
+            model(id=1, name="name", age=1, related=related_model(id=1))
+        ).data
+
+
+def timed(func, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    for eager in (True, False):
+        definition = timed(define_serializers, SERIALIZERS, eager)
+        print(
+            f"{'eager' if eager else 'lazy'} definition of "
+            f"{SERIALIZERS * 2} serializers: {definition * 1000:.1f} ms"
+        )
+
+    serializer_classes = define_serializers(SERIALIZERS, False)
+    cold = timed(first_requests, serializer_classes)
+    print(f"first requests without warmup: {cold * 1000:.1f} ms")
+
+    serializer_classes = define_serializers(SERIALIZERS, False)
+    warmup = timed(compile_all)
+    warm = timed(first_requests, serializer_classes)
+    print(f"compile_all: {warmup * 1000:.1f} ms")
+    print(f"first requests after warmup: {warm * 1000:.1f} ms")
@@ -0,0 +1,50 @@
+import time
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import Serializer
+
+
+class User(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(100), nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+    __tablename__ = "user"
+
+
+class UserSerializer(Serializer):
+    class Meta:
+        model = User
+
+
+def validate_one_serializer_per_row(rows: list) -> bool:
+    return all(UserSerializer(data=row).is_valid() for row in rows)
+
+
+def validate_in_bulk(rows: list) -> bool:
+    return UserSerializer(data=rows, many=True).is_valid()
+
+
+if __name__ == "__main__":
+    rows = [
+        {
+            "name": f"user {i}",
+            "email": f"user{i}@example.com",
+            "age": i % 90,
+            "is_active": bool(i % 2),
+        }
+        for i in range(100000)
+    ]
+
+    for name, func in (
+        ("one serializer per row", validate_one_serializer_per_row),
+        ("many=True", validate_in_bulk),
+    ):
+        start = time.perf_counter()
+        assert func(rows)
+        seconds = time.perf_counter() - start
+        print(f"{name}: {seconds:.3f}s for {len(rows):,} rows")
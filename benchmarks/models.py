@@ -0,0 +1,152 @@
+import enum
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+COLUMN_TYPES = (
+    lambda: sqlalchemy.String(50),
+    lambda: sqlalchemy.Integer(),
+    lambda: sqlalchemy.Boolean(),
+    lambda: sqlalchemy.Enum(Status),
+)
+
+
+def get_column_value(position: int, row: int) -> Any:
+    kind = position % len(COLUMN_TYPES)
+    if kind == 0:
+        return f"value {row}"
+
+    if kind == 1:
+        return row
+
+    if kind == 2:
+        return bool(row % 2)
+
+    return Status.ACTIVE if row % 2 else Status.INACTIVE
+
+
+def get_payload_value(position: int, row: int, valid: bool) -> Any:
+    kind = position % len(COLUMN_TYPES)
+    if not valid:
+        return ["not valid", None, "abc", None][kind]
+
+    if kind == 0:
+        return f"value {row}"
+
+    if kind == 1:
+        return row
+
+    if kind == 2:
+        return "true" if row % 2 else "false"
+
+    return "active"
+
+
+def make_schema(
+    width: int, depth: int, with_method: bool = False
+) -> Tuple[Any, List[Any], Any]:
+    """
+    Builds a chain of depth + 1 models, each with width columns, where
+    every model belongs to the next one, and the matching serializers.
+    Returns the declarative base, the models (root first) and the root
+    serializer class.
+    """
+    Base = declarative_base()
+
+    models = []
+    serializers = []
+    child_model = None
+    child_serializer = None
+    for level in range(depth, -1, -1):
+        attributes: Dict[str, Any] = {
+            "__tablename__": f"level_{level}",
+            "id": sqlalchemy.Column(sqlalchemy.Integer, primary_key=True),
+        }
+        for position in range(width - 1):
+            attributes[f"column_{position}"] = sqlalchemy.Column(
+                COLUMN_TYPES[position % len(COLUMN_TYPES)](),
+                nullable=position % 3 != 0,
+            )
+
+        if child_model is not None:
+            attributes["child_id"] = sqlalchemy.Column(
+                sqlalchemy.Integer,
+                sqlalchemy.ForeignKey(f"level_{level + 1}.id"),
+            )
+            attributes["child"] = relationship(child_model)
+
+        model = type(f"Level{level}", (Base,), attributes)
+
+        serializer_fields = ["id"] + [
+            f"column_{position}" for position in range(width - 1)
+        ]
+        serializer_attributes: Dict[str, Any] = {}
+        if child_serializer is not None:
+            serializer_attributes["child"] = child_serializer()
+            serializer_fields.append("child")
+
+        if with_method:
+            serializer_attributes["label"] = fields.MethodField()
+            serializer_attributes["get_label"] = lambda self, obj: f"#{obj.id}"
+            serializer_fields.append("label")
+
+        serializer_attributes["Meta"] = type(
+            "Meta", (), {"model": model, "fields": serializer_fields}
+        )
+        serializer = type(
+            f"Level{level}Serializer", (Serializer,), serializer_attributes
+        )
+
+        models.insert(0, model)
+        serializers.insert(0, serializer)
+        child_model = model
+        child_serializer = serializer
+
+    return Base, models, serializers[0]
+
+
+def make_instances(models: List[Any], width: int, size: int) -> List[Any]:
+    children = None
+    for model in reversed(models):
+        instances = []
+        for row in range(size):
+            values = {
+                f"column_{position}": get_column_value(position, row)
+                for position in range(width - 1)
+            }
+            if children is not None:
+                values["child"] = children[row]
+
+            instances.append(model(id=row, **values))
+
+        children = instances
+
+    return children
+
+
+def make_payloads(width: int, size: int, valid: bool) -> List[Dict[str, Any]]:
+    return [
+        {
+            f"column_{position}": get_payload_value(position, row, valid)
+            for position in range(width - 1)
+        }
+        for row in range(size)
+    ]
@@ -0,0 +1,176 @@
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+)
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from benchmarks.models import (
+    make_instances,
+    make_payloads,
+    make_schema,
+)
+
+DEFAULT_SIZES = (1, 100, 10_000, 100_000)
+
+FULL_SIZES = DEFAULT_SIZES + (1_000_000,)
+
+WIDTHS = (5, 20, 50)
+
+DEPTHS = (1, 3)
+
+REPEAT = 3
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    width: int
+    depth: int
+    setup: Callable[[int], Callable[[], Any]]
+
+
+def data_case(width: int, depth: int, with_method: bool = False):
+    def setup(size: int) -> Callable[[], Any]:
+        _, models, serializer_class = make_schema(width, depth, with_method)
+        serializer = serializer_class(
+            make_instances(models, width, size), many=True
+        )
+        return lambda: serializer.data
+
+    return setup
+
+
+def validation_case(width: int, valid: bool):
+    def setup(size: int) -> Callable[[], Any]:
+        _, _, serializer_class = make_schema(width, 0)
+        payloads = make_payloads(width, size, valid)
+
+        def run() -> None:
+            serializer = serializer_class(data=payloads, many=True)
+            assert serializer.is_valid() is valid
+
+        return run
+
+    return setup
+
+
+def sqlite_case(width: int, depth: int):
+    def setup(size: int) -> Callable[[], Any]:
+        Base, models, serializer_class = make_schema(width, depth)
+
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = Session(bind=engine)
+        session.add_all(make_instances(models, width, size))
+        session.commit()
+
+        def run() -> Any:
+            session.expunge_all()
+            query = session.query(models[0]).options(
+                *serializer_class.eager_options()
+            )
+            return serializer_class(query.all(), many=True).data
+
+        return run
+
+    return setup
+
+
+def get_cases() -> Iterator[Case]:
+    for width in WIDTHS:
+        yield Case(f"data/width={width}", "data", width, 0, data_case(width, 0))
+
+    for depth in DEPTHS:
+        yield Case(
+            f"data/depth={depth}", "data", 10, depth, data_case(10, depth)
+        )
+
+    yield Case("data/method", "data", 10, 0, data_case(10, 0, True))
+
+    for width in WIDTHS:
+        yield Case(
+            f"is_valid/width={width}",
+            "is_valid",
+            width,
+            0,
+            validation_case(width, True),
+        )
+        yield Case(
+            f"is_valid/invalid/width={width}",
+            "is_valid",
+            width,
+            0,
+            validation_case(width, False),
+        )
+
+    yield Case("sqlite/depth=1", "sqlite", 10, 1, sqlite_case(10, 1))
+
+
+def measure(func: Callable[[], Any], size: int, repeat: int = REPEAT) -> float:
+    number = max(1, 10_000 // size)
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    pattern: str = None,
+    repeat: int = REPEAT,
+    report: Callable[[Dict[str, Any]], None] = None,
+) -> List[Dict[str, Any]]:
+    results = []
+    for case in get_cases():
+        if pattern and pattern not in case.name:
+            continue
+
+        for size in sizes:
+            seconds = measure(case.setup(size), size, repeat)
+            result = {
+                "name": case.name,
+                "group": case.group,
+                "width": case.width,
+                "depth": case.depth,
+                "size": size,
+                "seconds": seconds,
+                "rows_per_second": size / seconds,
+            }
+            results.append(result)
+            if report:
+                report(result)
+
+    return results
+
+
+def compare(
+    baseline: List[Dict[str, Any]],
+    results: List[Dict[str, Any]],
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    previous = {(result["name"], result["size"]): result for result in baseline}
+
+    comparisons = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before is None:
+            continue
+
+        ratio = result["seconds"] / before["seconds"]
+        comparisons.append(
+            {
+                "name": result["name"],
+                "size": result["size"],
+                "before": before["seconds"],
+                "after": result["seconds"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+
+    return comparisons
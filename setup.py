@@ -24,6 +24,10 @@ setup(
     download_url="https://github.com/vinyguedess/alcherializer/archive/master.zip",
     keywords=["django", "flask", "serializer", "sql", "sqlalchemy", "alchemy"],
     install_requires=requirements,
+    extras_require={
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -0,0 +1,59 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from alcherializer import cache
+
+
+class TestLRUCache(TestCase):
+    def test_get_and_set(self) -> None:
+        lru = cache.LRUCache()
+        lru.set("key", {"id": 1})
+
+        self.assertEqual(lru.get("key"), {"id": 1})
+        self.assertIsNone(lru.get("missing"))
+
+    def test_evicts_least_recently_used(self) -> None:
+        lru = cache.LRUCache(maxsize=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertEqual(len(lru), 2)
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("c"), 3)
+
+    def test_expires_after_ttl(self) -> None:
+        lru = cache.LRUCache(ttl=10)
+        with mock.patch.object(cache.time, "monotonic", return_value=100):
+            lru.set("key", 1)
+
+        with mock.patch.object(cache.time, "monotonic", return_value=109):
+            self.assertEqual(lru.get("key"), 1)
+
+        with mock.patch.object(cache.time, "monotonic", return_value=110):
+            self.assertIsNone(lru.get("key"))
+
+        self.assertEqual(len(lru), 0)
+
+    def test_delete_and_clear(self) -> None:
+        lru = cache.LRUCache()
+        lru.set("a", 1)
+        lru.set("b", 2)
+
+        lru.delete("a")
+        lru.delete("missing")
+        self.assertIsNone(lru.get("a"))
+
+        lru.clear()
+        self.assertEqual(len(lru), 0)
+
+    def test_lookup_many_counts_hits_and_misses(self) -> None:
+        lru = cache.LRUCache()
+        lru.set("a", 1)
+
+        self.assertEqual(lru.lookup_many(["a", "b", "a"]), [1, None, 1])
+        self.assertEqual(lru.stats(), {"hits": 2, "misses": 1})
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import sqlalchemy
+
 from alcherializer import fields
 
 
@@ -10,3 +12,53 @@ class TestFieldsBaseCast(TestCase):
         self.assertEqual(base_field.cast(10), 10)
         self.assertEqual(base_field.cast("10"), "10")
         self.assertEqual(base_field.cast(True), True)
+
+
+class TestFieldsBaseRunValidator(TestCase):
+    def test_checks_are_collected_once_per_class(self) -> None:
+        class MyField(fields.BaseField):
+            def check_if_is_positive(self, value):
+                if value <= 0:
+                    return False, "Must be positive"
+
+                return True, None
+
+        self.assertEqual(
+            MyField._check_names,
+            ("check_if_is_positive", "check_if_required_and_filled"),
+        )
+        self.assertEqual(
+            fields.BaseField._check_names, ("check_if_required_and_filled",)
+        )
+
+    def test_value_is_cast_once(self) -> None:
+        casts = []
+
+        class MyField(fields.BaseField):
+            def cast(self, value):
+                casts.append(value)
+                return value
+
+            def check_if_is_positive(self, value):
+                if value <= 0:
+                    return False, "Must be positive"
+
+                return True, None
+
+        field = MyField(
+            "my_field", sqlalchemy.Column(sqlalchemy.Integer, nullable=False)
+        )
+
+        self.assertEqual(field.run_validator(-1), (False, ["Must be positive"]))
+        self.assertEqual(field.run_validator(1), (True, []))
+        self.assertEqual(casts, [-1, 1])
+
+    def test_fields_have_no_instance_dict(self) -> None:
+        for field_class in (
+            fields.BaseField,
+            fields.BooleanField,
+            fields.IntegerField,
+            fields.StringField,
+            fields.MethodField,
+        ):
+            self.assertFalse(hasattr(field_class(), "__dict__"))
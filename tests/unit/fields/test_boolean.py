@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import sqlalchemy
+
 from alcherializer import fields
 
 
@@ -30,3 +32,49 @@ class TestFieldsBooleanCast(TestCase):
         bool_field: fields.BooleanField = fields.BooleanField()
 
         self.assertNotIsInstance(bool_field.cast("abc"), bool)
+
+
+class TestFieldsBooleanRunColumnValidator(TestCase):
+    def setUp(self) -> None:
+        self.bool_field: fields.BooleanField = fields.BooleanField(
+            "my_field", sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+        )
+
+    def test_run_column_validator_with_booleans(self) -> None:
+        mask, errors = self.bool_field.run_column_validator([True, False] * 50)
+
+        self.assertEqual(mask, [True] * 100)
+        self.assertEqual(errors, {})
+
+    def test_run_column_validator_with_integers(self) -> None:
+        values = [1, 0] * 49 + [2, 1]
+        mask, errors = self.bool_field.run_column_validator(values)
+
+        self.assertEqual(mask, [True] * 98 + [False, True])
+        self.assertEqual(errors, {98: ["Not a valid boolean"]})
+
+    def test_run_column_validator_with_strings(self) -> None:
+        values = ["true", "f"] * 49 + ["abc", ""]
+        mask, errors = self.bool_field.run_column_validator(values)
+
+        self.assertEqual(mask, [True] * 98 + [False, False])
+        self.assertEqual(
+            errors,
+            {
+                98: ["Not a valid boolean"],
+                99: ["Can't be blank"],
+            },
+        )
+
+    def test_run_column_validator_with_mixed_values(self) -> None:
+        values = [True, "false"] * 49 + [None, "abc"]
+        mask, errors = self.bool_field.run_column_validator(values)
+
+        self.assertEqual(mask, [True] * 98 + [False, False])
+        self.assertEqual(
+            errors,
+            {
+                98: ["Can't be blank"],
+                99: ["Not a valid boolean"],
+            },
+        )
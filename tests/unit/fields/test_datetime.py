@@ -0,0 +1,72 @@
+import datetime
+from unittest import TestCase
+
+from alcherializer import fields
+
+
+class TestFieldsDateTime(TestCase):
+    def test_cast(self) -> None:
+        datetime_field: fields.DateTimeField = fields.DateTimeField()
+
+        self.assertEqual(
+            datetime_field.cast("2021-01-02T03:04:05"),
+            datetime.datetime(2021, 1, 2, 3, 4, 5),
+        )
+        self.assertEqual(datetime_field.cast("abc"), "abc")
+
+    def test_cast_utc_suffix(self) -> None:
+        datetime_field: fields.DateTimeField = fields.DateTimeField()
+
+        self.assertEqual(
+            datetime_field.cast("2021-01-02T03:04:05.123Z"),
+            datetime.datetime(
+                2021, 1, 2, 3, 4, 5, 123000, tzinfo=datetime.timezone.utc
+            ),
+        )
+        self.assertEqual(
+            datetime_field.cast("2021-01-02T03:04:05-03:00"),
+            datetime.datetime(
+                2021,
+                1,
+                2,
+                3,
+                4,
+                5,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=-3)),
+            ),
+        )
+        self.assertEqual(
+            datetime_field.run_validator("2021-01-02T03:04:05Z"), (True, [])
+        )
+
+    def test_run_validator(self) -> None:
+        datetime_field: fields.DateTimeField = fields.DateTimeField()
+
+        self.assertEqual(
+            datetime_field.run_validator(datetime.datetime.now()), (True, [])
+        )
+        self.assertEqual(
+            datetime_field.run_validator("2021-13-01"),
+            (False, ["Not a valid datetime"]),
+        )
+
+
+class TestFieldsDate(TestCase):
+    def test_cast(self) -> None:
+        date_field: fields.DateField = fields.DateField()
+
+        self.assertEqual(
+            date_field.cast("2021-01-02"), datetime.date(2021, 1, 2)
+        )
+        self.assertEqual(
+            date_field.cast(datetime.datetime(2021, 1, 2, 3)),
+            datetime.date(2021, 1, 2),
+        )
+
+    def test_run_validator(self) -> None:
+        date_field: fields.DateField = fields.DateField()
+
+        self.assertEqual(date_field.run_validator("2021-01-02"), (True, []))
+        self.assertEqual(
+            date_field.run_validator(10), (False, ["Not a valid date"])
+        )
@@ -0,0 +1,57 @@
+from decimal import Decimal
+from unittest import TestCase
+
+import sqlalchemy
+
+from alcherializer import fields
+
+
+class TestFieldsDecimalCast(TestCase):
+    def test_cast(self) -> None:
+        decimal_field: fields.DecimalField = fields.DecimalField()
+
+        self.assertEqual(decimal_field.cast(Decimal("1.5")), Decimal("1.5"))
+        self.assertEqual(decimal_field.cast("1.5"), Decimal("1.5"))
+        self.assertEqual(decimal_field.cast(1.1), Decimal("1.1"))
+        self.assertEqual(decimal_field.cast(2), Decimal(2))
+
+    def test_cast_invalid_value(self) -> None:
+        decimal_field: fields.DecimalField = fields.DecimalField()
+
+        self.assertEqual(decimal_field.cast("abc"), "abc")
+        self.assertEqual(decimal_field.cast(True), True)
+
+
+class TestFieldsDecimalRunValidator(TestCase):
+    def setUp(self) -> None:
+        self.decimal_field: fields.DecimalField = fields.DecimalField(
+            "price", sqlalchemy.Column(sqlalchemy.Numeric(5, 2))
+        )
+
+    def test_run_validator(self) -> None:
+        self.assertEqual(self.decimal_field.run_validator("123.45"), (True, []))
+        self.assertEqual(self.decimal_field.run_validator(None), (True, []))
+
+    def test_run_validator_with_invalid_number(self) -> None:
+        self.assertEqual(
+            self.decimal_field.run_validator("abc"),
+            (False, ["Not a valid number"]),
+        )
+        self.assertEqual(
+            self.decimal_field.run_validator("NaN"),
+            (False, ["Not a valid number"]),
+        )
+
+    def test_run_validator_with_too_many_digits(self) -> None:
+        self.assertEqual(
+            self.decimal_field.run_validator("1.234"),
+            (False, ["Limit of decimal places is 2"]),
+        )
+        self.assertEqual(
+            self.decimal_field.run_validator("12345.6"),
+            (False, ["Limit of digits is 5"]),
+        )
+        self.assertEqual(
+            self.decimal_field.run_validator("1234.5"),
+            (False, ["Limit of digits before the decimal point is 3"]),
+        )
@@ -0,0 +1,45 @@
+import enum
+from unittest import TestCase
+
+import sqlalchemy
+
+from alcherializer import fields
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class TestFieldsEnum(TestCase):
+    def setUp(self) -> None:
+        self.enum_field: fields.EnumField = fields.EnumField(
+            "status",
+            sqlalchemy.Column(sqlalchemy.Enum(Status), nullable=False),
+        )
+
+    def test_cast(self) -> None:
+        self.assertIs(self.enum_field.cast(Status.ACTIVE), Status.ACTIVE)
+        self.assertIs(self.enum_field.cast("active"), Status.ACTIVE)
+        self.assertIs(self.enum_field.cast("INACTIVE"), Status.INACTIVE)
+        self.assertEqual(self.enum_field.cast("unknown"), "unknown")
+
+    def test_run_validator(self) -> None:
+        self.assertEqual(self.enum_field.run_validator("active"), (True, []))
+        self.assertEqual(
+            self.enum_field.run_validator("unknown"),
+            (False, ["Not a valid choice"]),
+        )
+        self.assertEqual(
+            self.enum_field.run_validator(None), (False, ["Can't be blank"])
+        )
+
+    def test_run_validator_with_string_choices(self) -> None:
+        enum_field: fields.EnumField = fields.EnumField(
+            "status", sqlalchemy.Column(sqlalchemy.Enum("a", "b"))
+        )
+
+        self.assertEqual(enum_field.run_validator("a"), (True, []))
+        self.assertEqual(
+            enum_field.run_validator("c"), (False, ["Not a valid choice"])
+        )
@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from alcherializer import fields
+
+
+class TestFieldsFloatCast(TestCase):
+    def test_cast(self) -> None:
+        float_field: fields.FloatField = fields.FloatField()
+
+        self.assertEqual(float_field.cast(1.5), 1.5)
+        self.assertEqual(float_field.cast("1.5"), 1.5)
+        self.assertEqual(float_field.cast(2), 2.0)
+
+    def test_run_validator_with_invalid_number(self) -> None:
+        float_field: fields.FloatField = fields.FloatField()
+
+        self.assertEqual(float_field.run_validator("1.5"), (True, []))
+        self.assertEqual(
+            float_field.run_validator("abc"), (False, ["Not a valid number"])
+        )
+        self.assertEqual(
+            float_field.run_validator(True), (False, ["Not a valid number"])
+        )
@@ -1,4 +1,9 @@
-from unittest import TestCase
+from unittest import (
+    TestCase,
+    mock,
+)
+
+import sqlalchemy
 
 from alcherializer import fields
 
@@ -24,3 +29,30 @@ class TestFieldsIntegerCast(TestCase):
         int_field: fields.IntegerField = fields.IntegerField()
 
         self.assertEqual(int_field.cast(None), 0)
+
+
+class TestFieldsIntegerRunColumnValidator(TestCase):
+    def setUp(self) -> None:
+        self.int_field: fields.IntegerField = fields.IntegerField(
+            "my_field", sqlalchemy.Column(sqlalchemy.Integer, nullable=False)
+        )
+
+    def test_run_column_validator(self) -> None:
+        mask, errors = self.int_field.run_column_validator(list(range(100)))
+
+        self.assertEqual(mask, [True] * 100)
+        self.assertEqual(errors, {})
+
+    def test_run_column_validator_with_mixed_values(self) -> None:
+        values = list(range(99)) + ["10"]
+        mask, errors = self.int_field.run_column_validator(values)
+
+        self.assertEqual(mask, [True] * 100)
+        self.assertEqual(errors, {})
+
+    def test_run_column_validator_without_numpy(self) -> None:
+        with mock.patch.object(fields, "numpy", None):
+            mask, errors = self.int_field.run_column_validator(list(range(100)))
+
+        self.assertEqual(mask, [True] * 100)
+        self.assertEqual(errors, {})
@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from alcherializer import fields
+
+
+class TestFieldsJSON(TestCase):
+    def test_run_validator(self) -> None:
+        json_field: fields.JSONField = fields.JSONField()
+
+        self.assertEqual(
+            json_field.run_validator({"a": [1, 2.5, "b", None, {"c": True}]}),
+            (True, []),
+        )
+
+    def test_run_validator_with_invalid_json(self) -> None:
+        json_field: fields.JSONField = fields.JSONField()
+
+        self.assertEqual(
+            json_field.run_validator({"a": [object()]}),
+            (False, ["Not a valid JSON"]),
+        )
+        self.assertEqual(
+            json_field.run_validator({1: "a"}), (False, ["Not a valid JSON"])
+        )
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from alcherializer import fields
+
+
+class MyType(sqlalchemy.types.TypeDecorator):
+    impl = sqlalchemy.String
+
+    cache_ok = True
+
+
+class MyField(fields.StringField):
+    __slots__ = ()
+
+
+class TestFieldsGetFieldClass(TestCase):
+    def test_builtin_types(self) -> None:
+        for column_type, field_class in (
+            (sqlalchemy.Boolean(), fields.BooleanField),
+            (sqlalchemy.BigInteger(), fields.IntegerField),
+            (sqlalchemy.Text(), fields.StringField),
+            (sqlalchemy.Enum("a", "b"), fields.EnumField),
+            (sqlalchemy.Numeric(10, 2), fields.DecimalField),
+            (sqlalchemy.Float(), fields.FloatField),
+            (sqlalchemy.DateTime(), fields.DateTimeField),
+            (sqlalchemy.Date(), fields.DateField),
+            (sqlalchemy.Interval(), fields.BaseField),
+            (sqlalchemy.JSON(), fields.JSONField),
+            (postgresql.JSONB(), fields.JSONField),
+            (postgresql.UUID(), fields.UUIDField),
+            (sqlalchemy.LargeBinary(), fields.BaseField),
+        ):
+            with self.subTest(column_type=column_type):
+                self.assertIs(fields.get_field_class(column_type), field_class)
+
+    def test_type_decorator_resolves_to_its_implementation(self) -> None:
+        self.assertIs(fields.get_field_class(MyType()), fields.StringField)
+
+    def test_register_field(self) -> None:
+        self.assertIs(fields.get_field_class(MyType()), fields.StringField)
+
+        fields.register_field(MyType, MyField)
+        try:
+            self.assertIs(fields.get_field_class(MyType()), MyField)
+        finally:
+            del fields.field_classes[MyType]
+            fields._resolved_field_classes.clear()
@@ -0,0 +1,46 @@
+import uuid
+from unittest import TestCase
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from alcherializer import fields
+
+
+class TestFieldsUUID(TestCase):
+    def test_cast(self) -> None:
+        uuid_field: fields.UUIDField = fields.UUIDField()
+        value = uuid.uuid4()
+
+        self.assertEqual(uuid_field.cast(value), value)
+        self.assertEqual(uuid_field.cast(str(value)), value)
+        self.assertEqual(uuid_field.cast("abc"), "abc")
+
+    def test_run_validator(self) -> None:
+        uuid_field: fields.UUIDField = fields.UUIDField()
+
+        self.assertEqual(
+            uuid_field.run_validator(str(uuid.uuid4())), (True, [])
+        )
+        self.assertEqual(
+            uuid_field.run_validator("abc"), (False, ["Not a valid UUID"])
+        )
+
+    def test_cast_keeps_strings_for_string_columns(self) -> None:
+        value = uuid.uuid4()
+        uuid_field: fields.UUIDField = fields.UUIDField(
+            "uuid", sqlalchemy.Column(postgresql.UUID())
+        )
+
+        self.assertEqual(uuid_field.cast(str(value).upper()), str(value))
+        self.assertEqual(uuid_field.cast(value), str(value))
+        self.assertEqual(uuid_field.run_validator(str(value)), (True, []))
+        self.assertEqual(
+            uuid_field.run_validator("abc"), (False, ["Not a valid UUID"])
+        )
+
+        uuid_field = fields.UUIDField(
+            "uuid", sqlalchemy.Column(postgresql.UUID(as_uuid=True))
+        )
+
+        self.assertEqual(uuid_field.cast(str(value)), value)
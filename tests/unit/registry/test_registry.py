@@ -0,0 +1,98 @@
+import gc
+import weakref
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    compile_all,
+    registry,
+)
+
+Base = declarative_base()
+
+
+class MyRelatedModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+
+    __tablename__ = "my_related_model"
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    related_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+    )
+
+    related = relationship(MyRelatedModel)
+
+    __tablename__ = "my_model"
+
+
+class MyRelatedModelSerializer(Serializer):
+    class Meta:
+        model = MyRelatedModel
+
+
+class MyModelSerializer(Serializer):
+    related = MyRelatedModelSerializer()
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "related"]
+
+
+def test_serializers_are_registered() -> None:
+    class MyBaseSerializer(Serializer):
+        pass
+
+    assert MyModelSerializer in registry.serializers
+    assert MyBaseSerializer in registry.serializers
+    assert MyModelSerializer in registry.get_serializers()
+    assert MyBaseSerializer not in registry.get_serializers()
+
+
+def test_registry_does_not_keep_serializers_alive() -> None:
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    assert MySerializer in registry.serializers
+
+    reference = weakref.ref(MySerializer)
+    del MySerializer
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_schema_is_compiled_on_first_use() -> None:
+    MyModelSerializer.invalidate_schema()
+    MyRelatedModelSerializer.invalidate_schema()
+
+    serializer = MyModelSerializer()
+
+    assert MyModelSerializer._schema is None
+    assert list(serializer.fields) == ["id", "related"]
+    assert serializer.schema is MyModelSerializer._schema
+
+
+def test_warmup_compiles_nested_serializers() -> None:
+    MyModelSerializer.invalidate_schema()
+    MyRelatedModelSerializer.invalidate_schema()
+
+    schema = MyModelSerializer.warmup()
+
+    assert schema is MyModelSerializer._schema
+    assert MyRelatedModelSerializer._schema is not None
+
+
+def test_compile_all() -> None:
+    MyModelSerializer.invalidate_schema()
+    MyRelatedModelSerializer.invalidate_schema()
+
+    assert compile_all() == len(registry.get_serializers())
+    assert MyModelSerializer._schema is not None
+    assert MyRelatedModelSerializer._schema is not None
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+Base = declarative_base()
+
+
+class MyRelatedModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    hello = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+    __tablename__ = "my_related_model"
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    related_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+    )
+
+    related = relationship(MyRelatedModel, uselist=False)
+
+    __tablename__ = "my_model"
+
+
+class MyRelatedModelSerializer(Serializer):
+    shout = fields.MethodField()
+
+    async def get_shout(self, obj: MyRelatedModel) -> str:
+        await asyncio.sleep(0)
+        return obj.hello.upper()
+
+    class Meta:
+        model = MyRelatedModel
+        fields = ["id", "shout"]
+
+
+class MyModelSerializer(Serializer):
+    related = MyRelatedModelSerializer()
+    slow_name = fields.MethodField()
+    upper_name = fields.MethodField()
+
+    async def get_slow_name(self, obj: MyModel) -> str:
+        tracker = self.context["tracker"]
+        tracker["running"] += 1
+        tracker["max_running"] = max(tracker["max_running"], tracker["running"])
+        await asyncio.sleep(0.001)
+        tracker["running"] -= 1
+
+        return obj.name
+
+    def get_upper_name(self, obj: MyModel) -> str:
+        return obj.name.upper()
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "related", "slow_name", "upper_name"]
+
+
+def get_models():
+    return [
+        MyModel(
+            id=i,
+            name=f"name {i}",
+            related=MyRelatedModel(id=i, hello="world"),
+        )
+        for i in range(20)
+    ]
+
+
+def get_expected_row(i: int):
+    return {
+        "id": i,
+        "related": {"id": i, "shout": "WORLD"},
+        "slow_name": f"name {i}",
+        "upper_name": f"NAME {i}",
+    }
+
+
+def test_adata_single_instance() -> None:
+    tracker = {"running": 0, "max_running": 0}
+    serializer = MyModelSerializer(
+        get_models()[1], context={"tracker": tracker}
+    )
+
+    assert asyncio.run(serializer.adata()) == get_expected_row(1)
+
+
+def test_adata_limits_concurrency() -> None:
+    tracker = {"running": 0, "max_running": 0}
+    serializer = MyModelSerializer(
+        get_models(), many=True, context={"tracker": tracker}
+    )
+
+    data = asyncio.run(serializer.adata(concurrency=3))
+
+    assert data == [get_expected_row(i) for i in range(20)]
+    assert tracker["max_running"] == 3
+
+
+def test_aiter_data_from_async_iterable() -> None:
+    tracker = {"running": 0, "max_running": 0}
+    serializer = MyModelSerializer(context={"tracker": tracker})
+
+    async def stream():
+        for model in get_models():
+            await asyncio.sleep(0)
+            yield model
+
+    async def collect():
+        return [
+            row async for row in serializer.aiter_data(stream(), chunk_size=7)
+        ]
+
+    assert asyncio.run(collect()) == [get_expected_row(i) for i in range(20)]
+
+
+def test_aiter_data_from_async_session() -> None:
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        create_async_engine,
+    )
+
+    tracker = {"running": 0, "max_running": 0}
+    serializer = MyModelSerializer(context={"tracker": tracker})
+
+    async def collect():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            session.add_all(get_models())
+            await session.commit()
+
+        async with AsyncSession(engine) as session:
+            statement = MyModelSerializer.eager_load(
+                sqlalchemy.select(MyModel).order_by(MyModel.id)
+            )
+            result = await session.stream(statement)
+            rows = [
+                row async for row in serializer.aiter_data(result.scalars())
+            ]
+
+        await engine.dispose()
+
+        return rows
+
+    assert asyncio.run(collect()) == [get_expected_row(i) for i in range(20)]
+
+
+def test_adata_with_shared_related_object() -> None:
+    related = MyRelatedModel(id=1, hello="world")
+    models = [
+        MyModel(id=i, name=f"name {i}", related=related) for i in range(3)
+    ]
+    serializer = MyModelSerializer(
+        models,
+        many=True,
+        context={"tracker": {"running": 0, "max_running": 0}},
+    )
+
+    data = asyncio.run(serializer.adata())
+
+    assert [row["related"] for row in data] == [{"id": 1, "shout": "WORLD"}] * 3
@@ -0,0 +1,257 @@
+import asyncio
+import hashlib
+import json
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+from alcherializer.cache import (
+    BaseCache,
+    LRUCache,
+)
+
+
+class FakeRedisCache(BaseCache):
+    def __init__(self):
+        super().__init__()
+        self.store = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value):
+        self.store[key] = json.dumps(value)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+Base = declarative_base()
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    version = sqlalchemy.Column(sqlalchemy.Integer, nullable=False)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    version = sqlalchemy.Column(sqlalchemy.Integer, nullable=False)
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+
+    __tablename__ = "user"
+
+
+def get_serializers(manager_cache: BaseCache, user_cache: BaseCache):
+    class ManagerSerializer(Serializer):
+        class Meta:
+            model = Manager
+            fields = ["id", "name"]
+            cache = manager_cache
+            cache_version = "version"
+
+    class UserSerializer(Serializer):
+        manager = ManagerSerializer()
+        upper_name = fields.MethodField()
+
+        def get_upper_name(self, obj: User) -> str:
+            self.context["calls"].append(obj.id)
+            return obj.name.upper()
+
+        class Meta:
+            model = User
+            fields = ["id", "name", "manager", "upper_name"]
+            cache = user_cache
+            cache_version = "version"
+
+    return ManagerSerializer, UserSerializer
+
+
+def test_cache_key() -> None:
+    _, UserSerializer = get_serializers(LRUCache(), LRUCache())
+    fields_digest = hashlib.sha1(b"id,name,manager,upper_name").hexdigest()[:8]
+
+    assert UserSerializer.get_cache_key(User(id=1, version=3)) == (
+        f"{User.__module__}.User:"
+        f"{UserSerializer.__module__}.{UserSerializer.__qualname__}:"
+        f"{fields_digest}:1:3"
+    )
+    assert UserSerializer.get_cache_key(User(version=3)) is None
+
+
+def test_cache_key_changes_with_fields() -> None:
+    user_cache = FakeRedisCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+    user = User(id=1, name="user", version=1)
+    key = UserSerializer.get_cache_key(user)
+
+    UserSerializer.Meta.fields = ["id", "name", "upper_name"]
+
+    assert UserSerializer.get_cache_key(user) != key
+
+
+def test_cached_entry_missing_a_field_is_a_miss() -> None:
+    user_cache = FakeRedisCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+    user = User(id=1, name="user", version=1)
+    user_cache.set(UserSerializer.get_cache_key(user), {"id": 1})
+
+    data = UserSerializer(user, context={"calls": []}).data
+
+    assert data == {
+        "id": 1,
+        "name": "user",
+        "manager": None,
+        "upper_name": "USER",
+    }
+    assert user_cache.get(UserSerializer.get_cache_key(user)) == {
+        "id": 1,
+        "name": "user",
+        "upper_name": "USER",
+    }
+
+
+def test_serialized_rows_are_cached() -> None:
+    user_cache = LRUCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+    manager = Manager(id=1, name="boss", version=1)
+    users = [
+        User(id=i, name=f"user {i}", version=1, manager=manager)
+        for i in range(3)
+    ]
+    context = {"calls": []}
+
+    first = UserSerializer(users, many=True, context=context).data
+    second = UserSerializer(users, many=True, context=context).data
+
+    assert first == second
+    assert second[1] == {
+        "id": 1,
+        "name": "user 1",
+        "manager": {"id": 1, "name": "boss"},
+        "upper_name": "USER 1",
+    }
+    assert list(second[1].keys()) == ["id", "name", "manager", "upper_name"]
+    assert context["calls"] == [0, 1, 2]
+    assert user_cache.stats() == {"hits": 3, "misses": 3}
+
+
+def test_cached_rows_from_generator() -> None:
+    _, UserSerializer = get_serializers(LRUCache(), LRUCache())
+    users = [User(id=i, name=f"user {i}", version=1) for i in range(3)]
+    context = {"calls": []}
+
+    first = UserSerializer(
+        (user for user in users), many=True, context=context
+    ).data
+    second = UserSerializer(
+        (user for user in users), many=True, context=context
+    ).data
+
+    assert first == second
+    assert [row["id"] for row in second] == [0, 1, 2]
+
+
+def test_new_version_is_a_cache_miss() -> None:
+    user_cache = LRUCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+    user = User(id=1, name="user", version=1)
+    context = {"calls": []}
+
+    UserSerializer(user, context=context).data
+    user.name = "renamed"
+    user.version = 2
+
+    assert UserSerializer(user, context=context).data["name"] == "renamed"
+    assert user_cache.stats() == {"hits": 0, "misses": 2}
+
+
+def test_nested_serializers_are_cached_separately() -> None:
+    manager_cache = FakeRedisCache()
+    user_cache = FakeRedisCache()
+    _, UserSerializer = get_serializers(manager_cache, user_cache)
+    manager = Manager(id=1, name="boss", version=1)
+    user = User(id=1, name="user", version=1, manager=manager)
+    context = {"calls": []}
+
+    UserSerializer(user, context=context).data
+    manager.name = "new boss"
+    manager.version = 2
+
+    data = UserSerializer(user, context=context).data
+
+    assert data["manager"] == {"id": 1, "name": "new boss"}
+    assert user_cache.stats() == {"hits": 1, "misses": 1}
+    assert manager_cache.stats() == {"hits": 0, "misses": 2}
+    assert len(user_cache.store) == 1
+    assert len(manager_cache.store) == 2
+
+
+def test_invalidate_cache() -> None:
+    user_cache = LRUCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+    user = User(id=1, name="user", version=1)
+
+    UserSerializer(user, context={"calls": []}).data
+    UserSerializer.invalidate_cache(user)
+
+    assert len(user_cache) == 0
+
+
+def test_transient_instances_are_not_cached() -> None:
+    user_cache = LRUCache()
+    _, UserSerializer = get_serializers(LRUCache(), user_cache)
+
+    data = UserSerializer(
+        User(name="user", version=1), context={"calls": []}
+    ).data
+
+    assert data["name"] == "user"
+    assert len(user_cache) == 0
+    assert user_cache.stats() == {"hits": 0, "misses": 0}
+
+
+def test_rows_with_async_method_fields_are_not_cached() -> None:
+    user_cache = LRUCache()
+
+    class UserSerializer(Serializer):
+        rank = fields.MethodField()
+
+        async def get_rank(self, obj: User) -> int:
+            await asyncio.sleep(0)
+            return obj.id * 10
+
+        class Meta:
+            model = User
+            fields = ["id", "rank"]
+            cache = user_cache
+
+    user = User(id=1, name="user", version=1)
+
+    assert asyncio.run(UserSerializer(user).adata()) == {"id": 1, "rank": 10}
+    assert asyncio.run(UserSerializer(user).adata()) == {"id": 1, "rank": 10}
+    assert len(user_cache) == 0
+
+
+def test_cache_backend_must_implement_its_interface() -> None:
+    class IncompleteCache(BaseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteCache()
@@ -0,0 +1,155 @@
+import enum
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import (
+    Session,
+    relationship,
+)
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+Base = declarative_base()
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class Address(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    street = sqlalchemy.Column(sqlalchemy.String)
+    city = sqlalchemy.Column(sqlalchemy.String)
+    user_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey("user.id")
+    )
+
+    __tablename__ = "address"
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    status = sqlalchemy.Column(sqlalchemy.Enum(Status))
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+    addresses = relationship(Address, order_by=Address.id)
+
+    __tablename__ = "user"
+
+
+class AddressSerializer(Serializer):
+    class Meta:
+        model = Address
+        fields = ["id", "street", "city"]
+
+
+class ManagerSerializer(Serializer):
+    class Meta:
+        model = Manager
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+    addresses = AddressSerializer()
+    greeting = fields.MethodField()
+
+    def get_greeting(self, user: User) -> str:
+        return f"Hi, {user.name}"
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "status", "manager", "addresses", "greeting"]
+
+
+@pytest.fixture
+def session():
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    session.add(
+        User(
+            id=1,
+            name="Clark Kent",
+            status=Status.ACTIVE,
+            manager=Manager(id=1, name="Perry White"),
+            addresses=[
+                Address(id=1, street="Main St", city="Metropolis"),
+                Address(id=2, street="Farm Rd", city="Smallville"),
+            ],
+        )
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_changed_data_without_changes(session) -> None:
+    user = session.query(User).one()
+
+    assert UserSerializer(user).changed_data() == {}
+
+
+def test_changed_data(session) -> None:
+    user = session.query(User).one()
+    user.name = "Superman"
+    user.status = Status.INACTIVE
+
+    assert UserSerializer(user).changed_data() == {
+        "name": "Superman",
+        "status": "inactive",
+    }
+
+
+def test_changed_data_of_nested_serializers(session) -> None:
+    user = session.query(User).one()
+    addresses = user.addresses
+    user.manager.name = "Lois Lane"
+    addresses[1].city = "Gotham"
+
+    assert UserSerializer([user], many=True).changed_data() == [
+        {
+            "manager": {"name": "Lois Lane"},
+            "addresses": [{}, {"city": "Gotham"}],
+        }
+    ]
+
+
+def test_changed_data_when_relationship_changes(session) -> None:
+    user = session.query(User).one()
+    user.manager = Manager(id=2, name="Lois Lane")
+
+    assert UserSerializer(user).changed_data() == {
+        "manager": {"id": 2, "name": "Lois Lane"}
+    }
+
+
+def test_changed_data_is_reset_by_flush(session) -> None:
+    user = session.query(User).one()
+    user.name = "Superman"
+    session.flush()
+
+    assert UserSerializer(user).changed_data() == {}
+
+
+def test_changed_data_does_not_load_relationships(session) -> None:
+    user = session.query(User).one()
+    user.name = "Superman"
+
+    assert UserSerializer(user).changed_data() == {"name": "Superman"}
+    assert "addresses" in sqlalchemy.inspect(user).unloaded
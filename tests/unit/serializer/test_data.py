@@ -1,5 +1,6 @@
 import enum
 
+import pytest
 import sqlalchemy
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -230,3 +231,117 @@ def test_data_get_method_fields() -> None:
 
     serializer = MyModelSerializer(model)
     assert serializer.data == {"id": 1, "full_name": "hello world"}
+
+
+def test_data_method_field_errors_are_raised_unchanged() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_model"
+
+    class MyModelSerializer(Serializer):
+        nickname = fields.MethodField()
+
+        def get_nickname(self, obj: MyModel):
+            return obj.nickname
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "nickname"]
+
+    with pytest.raises(AttributeError, match="no attribute 'nickname'"):
+        MyModelSerializer(MyModel(id=1)).data
+
+
+def test_data_enum_fields_when_none() -> None:
+    class Option(enum.Enum):
+        OPTION_1 = 1
+
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        option = sqlalchemy.Column(sqlalchemy.Enum(Option))
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(MyModel(id=1, option=None))
+    assert serializer.data == {"id": 1, "option": None}
+
+
+def test_data_get_related_model_when_none() -> None:
+    class MyRelatedModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_related_model"
+
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        related_id = sqlalchemy.Column(
+            sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+        )
+
+        related = relationship(MyRelatedModel, uselist=False)
+
+        __tablename__ = "my_model"
+
+    class MyRelatedModelSerializer(Serializer):
+        class Meta:
+            model = MyRelatedModel
+
+    class MyModelSerializer(Serializer):
+        related = MyRelatedModelSerializer()
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "related"]
+
+    serializer = MyModelSerializer(
+        [
+            MyModel(id=1, related=[MyRelatedModel(id=1)]),
+            MyModel(id=2, related=[]),
+            MyModel(id=3, related=None),
+        ],
+        many=True,
+    )
+    assert serializer.data == [
+        {"id": 1, "related": [{"id": 1}]},
+        {"id": 2, "related": []},
+        {"id": 3, "related": None},
+    ]
+
+
+def test_data_keeps_fields_order() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        first_name = sqlalchemy.Column(sqlalchemy.String)
+        last_name = sqlalchemy.Column(sqlalchemy.String)
+
+        __tablename__ = "my_model"
+
+    class MyModelSerializer(Serializer):
+        full_name = fields.MethodField()
+
+        def get_full_name(self, obj: MyModel):
+            return f"{obj.first_name} {obj.last_name}"
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "full_name", "last_name"]
+
+    model = MyModel(id=1, first_name="hello", last_name="world")
+
+    serializer = MyModelSerializer(model)
+    assert list(serializer.data.keys()) == ["id", "last_name", "full_name"]
@@ -0,0 +1,161 @@
+import enum
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import (
+    Session,
+    relationship,
+)
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class Option(enum.Enum):
+    OPTION_1 = 1
+    OPTION_2 = 2
+
+
+Base = declarative_base()
+
+
+class MyRelatedModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+
+    __tablename__ = "my_related_model"
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    option = sqlalchemy.Column(sqlalchemy.Enum(Option))
+    related_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+    )
+
+    related = relationship(MyRelatedModel, uselist=False)
+
+    __tablename__ = "my_model"
+
+
+class MyRelatedModelSerializer(Serializer):
+    class Meta:
+        model = MyRelatedModel
+
+
+class MyModelSerializer(Serializer):
+    related = MyRelatedModelSerializer()
+    double_id = fields.MethodField()
+
+    def get_double_id(self, obj: MyModel) -> int:
+        return obj.id * 2
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "option", "related", "double_id"]
+
+
+class MyRowSerializer(Serializer):
+    class Meta:
+        model = MyModel
+        fields = ["id", "option"]
+
+
+class MyColumnsSerializer(Serializer):
+    double_id = fields.MethodField()
+    has_related = fields.MethodField()
+
+    def get_double_id(self, obj: MyModel) -> int:
+        return obj.id * 2
+
+    def get_has_related(self, obj: MyModel) -> bool:
+        return obj.related_id is not None
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "option", "double_id", "has_related"]
+
+
+def get_models():
+    return [
+        MyModel(
+            id=i,
+            option=Option.OPTION_1 if i % 2 else Option.OPTION_2,
+            related=MyRelatedModel(id=i),
+        )
+        for i in range(25)
+    ]
+
+
+def test_data_parallel_with_default_executor() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+
+    assert serializer.data_parallel(chunk_size=4) == serializer.data
+
+
+def test_data_parallel_with_thread_pool() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = serializer.data_parallel(executor, chunk_size=4)
+
+    assert results == serializer.data
+
+
+def test_data_parallel_with_process_pool() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    session.add_all(get_models())
+    session.commit()
+
+    rows = MyRowSerializer.project(session.query(MyModel)).all()
+    serializer = MyRowSerializer(rows, many=True)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = serializer.data_parallel(executor, chunk_size=4)
+
+    assert results == serializer.data
+    assert results[1] == {"id": 1, "option": 1}
+
+
+def test_data_parallel_with_process_pool_from_models() -> None:
+    models = get_models()
+    models[1].related_id = 1
+    serializer = MyColumnsSerializer(models, many=True)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = serializer.data_parallel(executor, chunk_size=4)
+
+    assert results == serializer.data
+    assert results[1] == {
+        "id": 1,
+        "option": 1,
+        "double_id": 2,
+        "has_related": True,
+    }
+
+
+def test_data_parallel_with_process_pool_rejects_related() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError):
+            serializer.data_parallel(executor)
+
+
+def test_data_parallel_single_instance() -> None:
+    serializer = MyModelSerializer(get_models()[3])
+
+    assert serializer.data_parallel() == {
+        "id": 3,
+        "option": 1,
+        "related": {"id": 3},
+        "double_id": 6,
+    }
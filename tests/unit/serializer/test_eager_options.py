@@ -0,0 +1,167 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import (
+    Session,
+    relationship,
+)
+
+from alcherializer import Serializer
+
+Base = declarative_base()
+
+
+class Country(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+    __tablename__ = "country"
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    country_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Country.id)
+    )
+
+    country = relationship(Country)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+    addresses = relationship("Address")
+
+    __tablename__ = "user"
+
+
+class Address(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    street = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    user_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(User.id)
+    )
+
+    __tablename__ = "address"
+
+
+class CountrySerializer(Serializer):
+    class Meta:
+        model = Country
+
+
+class ManagerSerializer(Serializer):
+    country = CountrySerializer()
+
+    class Meta:
+        model = Manager
+        fields = ["id", "name", "country"]
+
+
+class AddressSerializer(Serializer):
+    class Meta:
+        model = Address
+        fields = ["id", "street"]
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+    addresses = AddressSerializer()
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "manager", "addresses"]
+
+
+def get_session() -> Session:
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    session = Session(bind=engine)
+    for i in range(10):
+        session.add(
+            User(
+                id=i,
+                name=f"user {i}",
+                manager=Manager(
+                    id=i,
+                    name=f"manager {i}",
+                    country=Country(id=i, name=f"country {i}"),
+                ),
+                addresses=[
+                    Address(id=i * 2, street="street a"),
+                    Address(id=i * 2 + 1, street="street b"),
+                ],
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+    return session
+
+
+def count_statements(session: Session, callback) -> int:
+    statements = []
+
+    def before_cursor_execute(*args) -> None:
+        statements.append(args[2])
+
+    engine = session.get_bind()
+    sqlalchemy.event.listen(
+        engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        callback()
+    finally:
+        sqlalchemy.event.remove(
+            engine, "before_cursor_execute", before_cursor_execute
+        )
+
+    return len(statements)
+
+
+def test_eager_options() -> None:
+    options = UserSerializer.eager_options()
+
+    assert len(options) == 2
+    assert CountrySerializer.eager_options() == []
+
+
+def test_serializing_without_eager_loading_runs_n_plus_one_queries() -> None:
+    session = get_session()
+
+    def serialize() -> None:
+        UserSerializer(session.query(User).all(), many=True).data
+
+    assert count_statements(session, serialize) == 31
+
+
+def test_eager_load_avoids_n_plus_one_queries() -> None:
+    session = get_session()
+    data = []
+
+    def serialize() -> None:
+        users = UserSerializer.eager_load(session.query(User)).all()
+        data.extend(UserSerializer(users, many=True).data)
+
+    assert count_statements(session, serialize) == 2
+    assert data[3] == {
+        "id": 3,
+        "name": "user 3",
+        "manager": {
+            "id": 3,
+            "name": "manager 3",
+            "country": {"id": 3, "name": "country 3"},
+        },
+        "addresses": [
+            {"id": 6, "street": "street a"},
+            {"id": 7, "street": "street b"},
+        ],
+    }
@@ -270,3 +270,249 @@ def test_has_no_valid_length() -> None:
 
     assert serializer.is_valid() is False
     assert serializer.errors == {"name": ["Limit of characters is 6"]}
+
+
+def test_many_payloads() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String(6), nullable=False)
+        is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data=[
+            {"name": "Fulano", "is_active": True},
+            {"name": "Fulanos", "is_active": "abc"},
+            {"name": "Ciclano", "is_active": "f"},
+        ],
+        many=True,
+    )
+
+    assert serializer.is_valid() is False
+    assert serializer.errors == [
+        {},
+        {
+            "name": ["Limit of characters is 6"],
+            "is_active": ["Not a valid boolean"],
+        },
+        {"name": ["Limit of characters is 6"]},
+    ]
+    assert serializer.validated_data == [
+        {"name": "Fulano", "is_active": True},
+        {},
+        {"is_active": "f"},
+    ]
+
+
+def test_many_valid_payloads_and_clearing_serializer() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data=[{"name": "Fulano"}, {"name": "Ciclano"}], many=True
+    )
+
+    assert serializer.is_valid()
+    assert serializer.errors == [{}, {}]
+    assert serializer.validated_data == [
+        {"name": "Fulano"},
+        {"name": "Ciclano"},
+    ]
+
+    serializer.clear()
+    assert serializer.errors == []
+    assert serializer.validated_data == []
+
+
+def test_many_without_payloads() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(many=True)
+
+    assert serializer.is_valid()
+    assert serializer.errors == []
+
+
+def test_common_column_types_are_validated() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        price = sqlalchemy.Column(sqlalchemy.Numeric(5, 2))
+        created_at = sqlalchemy.Column(sqlalchemy.DateTime)
+        status = sqlalchemy.Column(sqlalchemy.Enum("draft", "published"))
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data={"price": "1.234", "created_at": "yesterday", "status": "draft"}
+    )
+
+    assert serializer.is_valid() is False
+    assert serializer.errors == {
+        "price": ["Limit of decimal places is 2"],
+        "created_at": ["Not a valid datetime"],
+    }
+
+
+def test_partial_validates_only_submitted_keys() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String(10), nullable=False)
+        email = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+        is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(data={"name": "Clark"}, partial=True)
+
+    assert serializer.is_valid()
+    assert serializer.validated_data == {"name": "Clark"}
+
+    serializer = MySerializer(
+        data={"name": None, "unknown": 1, "id": None}, partial=True
+    )
+
+    assert serializer.is_valid() is False
+    assert serializer.errors == {"name": ["Can't be blank"]}
+
+
+def test_partial_validates_only_submitted_keys_of_many_payloads() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String(10), nullable=False)
+        is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data=[
+            {"name": "Clark"},
+            {"is_active": "abc"},
+            {"name": "Clark Joseph Kent", "is_active": True},
+        ],
+        many=True,
+        partial=True,
+    )
+
+    assert serializer.is_valid() is False
+    assert serializer.errors == [
+        {},
+        {"is_active": ["Not a valid boolean"]},
+        {"name": ["Limit of characters is 10"]},
+    ]
+    assert serializer.validated_data == [
+        {"name": "Clark"},
+        {},
+        {"is_active": True},
+    ]
+
+
+def test_fail_fast_stops_at_first_error() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String(10), nullable=False)
+        is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data={"name": "Clark Joseph Kent", "is_active": "abc"}
+    )
+
+    assert serializer.is_valid(fail_fast=True) is False
+    assert serializer.errors == {"name": ["Limit of characters is 10"]}
+
+
+def test_max_errors_stops_many_payloads() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String(10), nullable=False)
+        is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(
+        data=[
+            {"name": "Clark", "is_active": True},
+            {"name": None, "is_active": "abc"},
+            {"name": "Clark Joseph Kent", "is_active": True},
+            {"name": None, "is_active": None},
+        ],
+        many=True,
+    )
+
+    assert serializer.is_valid(max_errors=3) is False
+    assert serializer.errors == [
+        {},
+        {"name": ["Can't be blank"], "is_active": ["Not a valid boolean"]},
+        {"name": ["Limit of characters is 10"]},
+        {},
+    ]
+    assert serializer.validated_data == [
+        {"name": "Clark", "is_active": True},
+        {},
+        {},
+        {},
+    ]
+
+    assert serializer.is_valid(fail_fast=True) is False
+    assert serializer.errors == [
+        {},
+        {"name": ["Can't be blank"]},
+        {},
+        {},
+    ]
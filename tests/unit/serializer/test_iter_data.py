@@ -0,0 +1,154 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import (
+    Session,
+    relationship,
+)
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+def test_iter_data_yields_one_dict_at_a_time() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    consumed = []
+
+    def instances():
+        for i in range(3):
+            consumed.append(i)
+            yield MyModel(id=i, name=f"name {i}")
+
+    iterator = MySerializer(many=True).iter_data(instances())
+
+    assert next(iterator) == {"id": 0, "name": "name 0"}
+    assert consumed == [0]
+    assert list(iterator) == [
+        {"id": 1, "name": "name 1"},
+        {"id": 2, "name": "name 2"},
+    ]
+
+
+def test_iter_data_in_chunks() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer([MyModel(id=i) for i in range(5)], many=True)
+
+    assert list(serializer.iter_data(chunk_size=2)) == [
+        [{"id": 0}, {"id": 1}],
+        [{"id": 2}, {"id": 3}],
+        [{"id": 4}],
+    ]
+
+
+def test_iter_data_single_instance() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    serializer = MySerializer(MyModel(id=1))
+
+    assert list(serializer.iter_data()) == [{"id": 1}]
+
+
+def test_iter_data_from_query_with_nested_and_method_fields() -> None:
+    Base = declarative_base()
+
+    class MyRelatedModel(Base):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        hello = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_related_model"
+
+    class MyModel(Base):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+        related_id = sqlalchemy.Column(
+            sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+        )
+
+        related = relationship(MyRelatedModel, uselist=False)
+
+        __tablename__ = "my_model"
+
+    class MyRelatedModelSerializer(Serializer):
+        class Meta:
+            model = MyRelatedModel
+
+    class MyModelSerializer(Serializer):
+        related = MyRelatedModelSerializer()
+        upper_name = fields.MethodField()
+
+        def get_upper_name(self, obj: MyModel) -> str:
+            return obj.name.upper()
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "related", "upper_name"]
+
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    session.add_all(
+        MyModel(
+            id=i,
+            name=f"name {i}",
+            related=MyRelatedModel(id=i, hello="world"),
+        )
+        for i in range(4)
+    )
+    session.commit()
+
+    query = session.query(MyModel).order_by(MyModel.id).yield_per(2)
+    chunks = list(MyModelSerializer().iter_data(query, chunk_size=3))
+    session.close()
+
+    assert chunks == [
+        [
+            {
+                "id": i,
+                "related": {"id": i, "hello": "world"},
+                "upper_name": f"NAME {i}",
+            }
+            for i in range(3)
+        ],
+        [
+            {
+                "id": 3,
+                "related": {"id": 3, "hello": "world"},
+                "upper_name": "NAME 3",
+            }
+        ],
+    ]
@@ -0,0 +1,138 @@
+import datetime
+import decimal
+import enum
+import io
+import uuid
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    encoders,
+)
+
+
+class Option(enum.Enum):
+    OPTION_1 = "option 1"
+
+
+Base = declarative_base()
+
+
+class MyRelatedModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    hello = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+    __tablename__ = "my_related_model"
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    option = sqlalchemy.Column(sqlalchemy.Enum(Option))
+    price = sqlalchemy.Column(sqlalchemy.Numeric)
+    created_at = sqlalchemy.Column(sqlalchemy.DateTime)
+    related_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+    )
+
+    related = relationship(MyRelatedModel, uselist=False)
+
+    __tablename__ = "my_model"
+
+
+class MyRelatedModelSerializer(Serializer):
+    class Meta:
+        model = MyRelatedModel
+
+
+class MyModelSerializer(Serializer):
+    related = MyRelatedModelSerializer()
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "name", "option", "price", "created_at", "related"]
+
+
+def get_models():
+    return [
+        MyModel(
+            id=1,
+            name="ação",
+            option=Option.OPTION_1,
+            price=decimal.Decimal("10.50"),
+            created_at=datetime.datetime(2021, 1, 2, 3, 4, 5),
+            related=MyRelatedModel(id=1, hello="world"),
+        ),
+        MyModel(id=2),
+    ]
+
+
+EXPECTED_ROWS = [
+    '{"id":1,"name":"ação","option":"option 1","price":"10.50",'
+    '"created_at":"2021-01-02T03:04:05","related":{"id":1,"hello":"world"}}',
+    '{"id":2,"name":null,"option":null,"price":null,'
+    '"created_at":null,"related":null}',
+]
+
+
+def test_to_json_single_instance() -> None:
+    serializer = MyModelSerializer(get_models()[0])
+
+    assert serializer.to_json() == EXPECTED_ROWS[0]
+
+
+def test_to_json_multiple_instances() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+
+    assert serializer.to_json() == f"[{','.join(EXPECTED_ROWS)}]"
+
+
+def test_to_json_without_orjson() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+
+    with mock.patch.object(encoders, "orjson", None):
+        assert serializer.to_json() == f"[{','.join(EXPECTED_ROWS)}]"
+
+
+def test_write_ndjson_to_text_file() -> None:
+    fp = io.StringIO()
+    MyModelSerializer(get_models(), many=True).write_ndjson(fp, chunk_size=1)
+
+    assert fp.getvalue() == "".join(f"{row}\n" for row in EXPECTED_ROWS)
+
+
+def test_write_ndjson_to_binary_file() -> None:
+    fp = io.BytesIO()
+    MyModelSerializer().write_ndjson(fp, get_models())
+
+    assert fp.getvalue().decode() == "".join(
+        f"{row}\n" for row in EXPECTED_ROWS
+    )
+
+
+def test_dumps_matches_without_orjson() -> None:
+    values = [
+        {
+            "nan": float("nan"),
+            "infinity": [float("inf")],
+            1: "int key",
+            Option.OPTION_1: "enum key",
+            datetime.date(2021, 1, 2): "date key",
+            uuid.UUID(int=1): "uuid key",
+        },
+        {"big": 2**70},
+    ]
+    expected = [
+        '{"nan":null,"infinity":[null],"1":"int key",'
+        '"option 1":"enum key","2021-01-02":"date key",'
+        '"00000000-0000-0000-0000-000000000001":"uuid key"}',
+        '{"big":1180591620717411303424}',
+    ]
+
+    assert [encoders.dumps(value).decode() for value in values] == expected
+    with mock.patch.object(encoders, "orjson", None):
+        assert [encoders.dumps(value).decode() for value in values] == expected
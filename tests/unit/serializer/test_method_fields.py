@@ -0,0 +1,129 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class MyModel(declarative_base()):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    currency = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+    __tablename__ = "my_model"
+
+
+Row = namedtuple("Row", ["id", "currency"])
+
+
+class MyBatchSerializer(Serializer):
+    rate = fields.MethodField()
+
+    def get_rate_many(self, objs):
+        self.context["calls"].append([obj.id for obj in objs])
+        return [f"{obj.currency}/USD" for obj in objs]
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "rate"]
+
+
+class MyMemoizedBatchSerializer(MyBatchSerializer):
+    rate = fields.MethodField(memo_key=lambda obj: obj.currency)
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "rate"]
+
+
+def get_models():
+    return [MyModel(id=i, currency="BRL" if i % 2 else "EUR") for i in range(6)]
+
+
+def get_expected_data():
+    return [
+        {"id": i, "rate": "BRL/USD" if i % 2 else "EUR/USD"} for i in range(6)
+    ]
+
+
+def test_batch_method_field_is_called_once_per_batch() -> None:
+    context = {"calls": []}
+    serializer = MyBatchSerializer(get_models(), many=True, context=context)
+
+    assert serializer.data == get_expected_data()
+    assert context["calls"] == [[0, 1, 2, 3, 4, 5]]
+
+
+def test_batch_method_field_single_instance() -> None:
+    context = {"calls": []}
+    serializer = MyBatchSerializer(get_models()[1], context=context)
+
+    assert serializer.data == {"id": 1, "rate": "BRL/USD"}
+    assert context["calls"] == [[1]]
+
+
+def test_batch_method_field_from_generator() -> None:
+    context = {"calls": []}
+    serializer = MyBatchSerializer(
+        (model for model in get_models()), many=True, context=context
+    )
+
+    assert serializer.data == get_expected_data()
+    assert context["calls"] == [[0, 1, 2, 3, 4, 5]]
+
+
+def test_batch_method_field_per_chunk() -> None:
+    context = {"calls": []}
+    serializer = MyBatchSerializer(context=context)
+
+    chunks = list(serializer.iter_data(get_models(), chunk_size=4))
+
+    assert chunks == [get_expected_data()[:4], get_expected_data()[4:]]
+    assert context["calls"] == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_memoized_batch_method_field() -> None:
+    context = {"calls": []}
+    serializer = MyMemoizedBatchSerializer(context=context)
+
+    chunks = list(serializer.iter_data(get_models(), chunk_size=4))
+
+    assert chunks == [get_expected_data()[:4], get_expected_data()[4:]]
+    assert context["calls"] == [[0, 1]]
+
+
+def test_memoized_batch_method_field_on_process_pool() -> None:
+    rows = [Row(model.id, model.currency) for model in get_models()]
+    serializer = MyMemoizedBatchSerializer(
+        rows, many=True, context={"calls": []}
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = serializer.data_parallel(executor, chunk_size=4)
+
+    assert results == get_expected_data()
+
+
+def test_memoized_method_field() -> None:
+    calls = []
+
+    class MySerializer(Serializer):
+        rate = fields.MethodField(memo_key=lambda obj: obj.currency)
+
+        def get_rate(self, obj: MyModel) -> str:
+            calls.append(obj.id)
+            return f"{obj.currency}/USD"
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "rate"]
+
+    assert MySerializer(get_models(), many=True).data == get_expected_data()
+    assert calls == [0, 1]
+
+    assert MySerializer(get_models(), many=True).data == get_expected_data()
+    assert calls == [0, 1, 0, 1]
@@ -0,0 +1,234 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+Base = declarative_base()
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager, backref="users")
+
+    __tablename__ = "user"
+
+
+class Employee(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    boss_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey("employee.id")
+    )
+
+    boss = relationship("Employee", remote_side=[id])
+
+    __tablename__ = "employee"
+
+
+class ManagerSerializer(Serializer):
+    title = fields.MethodField()
+
+    def get_title(self, manager: Manager) -> str:
+        self.context["calls"].append(manager.id)
+        return f"Mr. {manager.name}"
+
+    class Meta:
+        model = Manager
+        fields = ["id", "name", "title"]
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "manager"]
+
+
+class CyclicManagerSerializer(Serializer):
+    class Meta:
+        model = Manager
+        fields = ["id", "users"]
+
+
+class CyclicUserSerializer(Serializer):
+    manager = CyclicManagerSerializer()
+
+    class Meta:
+        model = User
+        fields = ["id", "manager"]
+
+
+CyclicManagerSerializer.users = CyclicUserSerializer()
+
+
+class EmployeeSerializer(Serializer):
+    class Meta:
+        model = Employee
+        fields = ["id", "boss"]
+
+
+EmployeeSerializer.boss = EmployeeSerializer()
+
+
+def get_users():
+    managers = [Manager(id=i, name=f"Manager {i}") for i in range(2)]
+    return [
+        User(id=i, name=f"User {i}", manager=managers[i % 2]) for i in range(6)
+    ]
+
+
+def test_shared_related_objects_are_serialized_once() -> None:
+    context = {"calls": []}
+    data = UserSerializer(get_users(), many=True, context=context).data
+
+    assert context["calls"] == [0, 1]
+    assert data[0] == {
+        "id": 0,
+        "name": "User 0",
+        "manager": {"id": 0, "name": "Manager 0", "title": "Mr. Manager 0"},
+    }
+    assert data[2]["manager"] == data[0]["manager"]
+    assert data[3]["manager"] == {
+        "id": 1,
+        "name": "Manager 1",
+        "title": "Mr. Manager 1",
+    }
+
+
+def test_memo_is_per_call() -> None:
+    context = {"calls": []}
+    serializer = UserSerializer(get_users(), many=True, context=context)
+
+    serializer.data
+    serializer.data
+
+    assert context["calls"] == [0, 1, 0, 1]
+
+
+def test_normalized_data() -> None:
+    context = {"calls": []}
+    users = get_users()[:3]
+    data = UserSerializer(users, many=True, context=context).normalized_data()
+
+    assert data == {
+        "items": [
+            {
+                "id": 0,
+                "name": "User 0",
+                "manager": {"type": "Manager", "id": "0"},
+            },
+            {
+                "id": 1,
+                "name": "User 1",
+                "manager": {"type": "Manager", "id": "1"},
+            },
+            {
+                "id": 2,
+                "name": "User 2",
+                "manager": {"type": "Manager", "id": "0"},
+            },
+        ],
+        "included": {
+            "Manager": {
+                "0": {"id": 0, "name": "Manager 0", "title": "Mr. Manager 0"},
+                "1": {"id": 1, "name": "Manager 1", "title": "Mr. Manager 1"},
+            }
+        },
+    }
+
+
+def test_cycles_are_replaced_by_references() -> None:
+    manager = Manager(id=1)
+    User(id=1, manager=manager)
+    User(id=2, manager=manager)
+
+    data = CyclicManagerSerializer(manager).data
+
+    assert data == {
+        "id": 1,
+        "users": [
+            {"id": 1, "manager": {"type": "Manager", "id": "1"}},
+            {"id": 2, "manager": {"type": "Manager", "id": "1"}},
+        ],
+    }
+
+
+def test_max_depth() -> None:
+    class MyUserSerializer(CyclicUserSerializer):
+        manager = CyclicManagerSerializer()
+
+        class Meta:
+            model = User
+            fields = ["id", "manager"]
+            max_depth = 1
+
+    manager = Manager(id=1)
+    user = User(id=1, manager=manager)
+
+    assert MyUserSerializer(user).data == {
+        "id": 1,
+        "manager": {"id": 1, "users": [{"type": "User", "id": "1"}]},
+    }
+
+
+def test_siblings_in_a_batch_are_not_cycles() -> None:
+    bob = Employee(id=2)
+    alice = Employee(id=1, boss=bob)
+
+    data = EmployeeSerializer([alice, bob], many=True).data
+
+    assert data == [
+        EmployeeSerializer(alice).data,
+        EmployeeSerializer(bob).data,
+    ]
+    assert data[0] == {"id": 1, "boss": {"id": 2, "boss": None}}
+
+
+def test_cycles_do_not_depend_on_the_batch() -> None:
+    manager = Manager(id=1)
+    users = [User(id=1, manager=manager), User(id=2, manager=manager)]
+
+    data = CyclicUserSerializer(users, many=True).data
+
+    assert data == [CyclicUserSerializer(user).data for user in users]
+    assert data[1] == {
+        "id": 2,
+        "manager": {
+            "id": 1,
+            "users": [
+                {"id": 1, "manager": {"type": "Manager", "id": "1"}},
+                {"type": "User", "id": "2"},
+            ],
+        },
+    }
+
+
+def test_rows_with_cycles_are_not_shared() -> None:
+    alice = Employee(id=1)
+    bob = Employee(id=2)
+    carol = Employee(id=3, boss=alice)
+    bob.boss = carol
+    alice.boss = bob
+
+    data = EmployeeSerializer([alice, carol], many=True).data
+
+    assert data == [
+        EmployeeSerializer(alice).data,
+        EmployeeSerializer(carol).data,
+    ]
@@ -0,0 +1,129 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+from alcherializer.instrumentation import Profiler
+
+Base = declarative_base()
+
+
+class MyRelatedModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    hello = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+    __tablename__ = "my_related_model"
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String(10), nullable=False)
+    related_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+    )
+
+    related = relationship(MyRelatedModel)
+
+    __tablename__ = "my_model"
+
+
+class MyRelatedModelSerializer(Serializer):
+    class Meta:
+        model = MyRelatedModel
+        fields = ["id", "hello"]
+
+
+class MyModelSerializer(Serializer):
+    related = MyRelatedModelSerializer()
+    greeting = fields.MethodField()
+
+    def get_greeting(self, obj: MyModel) -> str:
+        return f"Hi, {obj.name}"
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "name", "related", "greeting"]
+
+
+class MyValidationSerializer(Serializer):
+    class Meta:
+        model = MyModel
+        fields = ["id", "name"]
+
+
+def get_models():
+    return [
+        MyModel(id=i, name="Clark", related=MyRelatedModel(id=i, hello="hi"))
+        for i in range(3)
+    ]
+
+
+def test_profile_data() -> None:
+    serializer = MyModelSerializer(get_models(), many=True)
+    expected_data = serializer.data
+
+    with serializer.profile() as profiler:
+        assert serializer.data == expected_data
+
+    stats = profiler.to_dict()
+    assert sorted(stats["data"]) == [
+        "greeting",
+        "id",
+        "name",
+        "related",
+        "related.hello",
+        "related.id",
+    ]
+    assert stats["data"]["greeting"]["calls"] == 3
+    assert stats["data"]["related.hello"]["calls"] == 3
+    assert (
+        stats["data"]["related"]["total_time"]
+        >= stats["data"]["related.hello"]["total_time"]
+    )
+    assert stats["is_valid"] == {}
+
+    assert serializer.profiler is None
+
+
+def test_profile_is_valid() -> None:
+    serializer = MyValidationSerializer(
+        data=[{"name": "Clark"}, {"name": "Clark Joseph Kent"}], many=True
+    )
+
+    with serializer.profile() as profiler:
+        assert serializer.is_valid() is False
+
+    stats = profiler.to_dict()["is_valid"]
+    assert stats["name"]["calls"] == 1
+    assert stats["name.check_if_length_is_under_limit"]["calls"] == 2
+    assert stats["name.check_if_required_and_filled"]["calls"] == 2
+    assert "id" not in stats
+
+
+def test_profile_spans() -> None:
+    spans = []
+    serializer = MyValidationSerializer(
+        MyModel(id=1, name="Clark"), profiler=Profiler(spans.append)
+    )
+
+    assert serializer.data == {"id": 1, "name": "Clark"}
+    assert [span["name"] for span in spans] == ["data id", "data name"]
+    assert spans[0]["attributes"] == {
+        "alcherializer.operation": "data",
+        "alcherializer.field": "id",
+    }
+    assert spans[0]["start_time"] <= spans[0]["end_time"]
+
+
+def test_profile_reset() -> None:
+    serializer = MyValidationSerializer(MyModel(id=1, name="Clark"))
+
+    with serializer.profile() as profiler:
+        serializer.data
+
+    profiler.reset()
+
+    assert profiler.to_dict() == {"data": {}, "is_valid": {}}
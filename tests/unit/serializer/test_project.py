@@ -0,0 +1,117 @@
+import enum
+
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+class Option(enum.Enum):
+    OPTION_1 = 1
+    OPTION_2 = 2
+
+
+Base = declarative_base()
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column("my_name", sqlalchemy.String, nullable=False)
+    option = sqlalchemy.Column(sqlalchemy.Enum(Option))
+    description = sqlalchemy.Column(sqlalchemy.Text)
+
+    __tablename__ = "my_model"
+
+
+class MySerializer(Serializer):
+    class Meta:
+        model = MyModel
+        fields = ["id", "name", "option"]
+
+
+class MyMethodSerializer(Serializer):
+    upper_name = fields.MethodField()
+
+    def get_upper_name(self, obj: MyModel) -> str:
+        return obj.name.upper()
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "upper_name"]
+
+
+def get_session() -> Session:
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    session = Session(bind=engine)
+    session.add_all(
+        MyModel(
+            id=i,
+            name=f"name {i}",
+            option=Option.OPTION_1 if i % 2 else Option.OPTION_2,
+            description="long text",
+        )
+        for i in range(3)
+    )
+    session.commit()
+    session.expunge_all()
+
+    return session
+
+
+def test_projection_columns() -> None:
+    assert MySerializer.projection_columns() == [
+        MyModel.id,
+        MyModel.name,
+        MyModel.option,
+    ]
+    assert MyMethodSerializer.projection_columns() is None
+
+
+def test_project_query() -> None:
+    session = get_session()
+    query = session.query(MyModel).order_by(MyModel.id)
+
+    rows = MySerializer.project(query).all()
+
+    assert not isinstance(rows[0], MyModel)
+    assert MySerializer(rows, many=True).data == [
+        {"id": 0, "name": "name 0", "option": 2},
+        {"id": 1, "name": "name 1", "option": 1},
+        {"id": 2, "name": "name 2", "option": 2},
+    ]
+    assert (
+        MySerializer(rows, many=True).data
+        == MySerializer(query.all(), many=True).data
+    )
+
+
+def test_project_select_statement() -> None:
+    session = get_session()
+    statement = MySerializer.project(
+        sqlalchemy.select([MyModel]).where(MyModel.id == 1)
+    )
+
+    rows = session.execute(statement).fetchall()
+
+    assert MySerializer(rows[0]).data == {
+        "id": 1,
+        "name": "name 1",
+        "option": 1,
+    }
+
+
+def test_project_falls_back_to_instances_for_method_fields() -> None:
+    session = get_session()
+    query = session.query(MyModel).order_by(MyModel.id)
+
+    assert MyMethodSerializer.project(query) is query
+    assert MyMethodSerializer(query.all(), many=True).data[1] == {
+        "id": 1,
+        "upper_name": "NAME 1",
+    }
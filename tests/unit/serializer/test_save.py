@@ -0,0 +1,156 @@
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+from alcherializer.exceptions import InvalidDataException
+
+Base = declarative_base()
+
+
+class MyModel(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(20), nullable=False)
+    age = sqlalchemy.Column(sqlalchemy.Integer)
+    is_active = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False)
+
+    __tablename__ = "my_model"
+
+
+class MySerializer(Serializer):
+    class Meta:
+        model = MyModel
+
+
+class MyMethodSerializer(Serializer):
+    shout = fields.MethodField()
+
+    def get_shout(self, obj: MyModel) -> str:
+        return obj.name.upper()
+
+    class Meta:
+        model = MyModel
+        fields = ["id", "name", "is_active", "shout"]
+
+
+@pytest.fixture
+def session():
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    yield session
+    session.close()
+
+
+def test_save(session) -> None:
+    serializer = MySerializer(
+        data={"name": "Clark Kent", "age": "31", "is_active": "true"}
+    )
+    assert serializer.is_valid()
+
+    instance = serializer.save(session)
+    session.commit()
+
+    assert instance is serializer.instance
+    assert session.query(
+        MyModel.name, MyModel.age, MyModel.is_active
+    ).all() == [("Clark Kent", 31, True)]
+
+
+def test_save_skips_method_fields(session) -> None:
+    serializer = MyMethodSerializer(
+        data={"name": "Clark Kent", "is_active": True}
+    )
+    assert serializer.is_valid()
+
+    instance = serializer.save(session)
+    session.commit()
+
+    assert instance.name == "Clark Kent"
+    assert MyMethodSerializer(instance).data["shout"] == "CLARK KENT"
+
+    serializer = MyMethodSerializer(
+        data=[{"name": "Lois Lane", "is_active": True}], many=True
+    )
+    assert serializer.is_valid()
+
+    serializer.save_many(session)
+    session.commit()
+
+    assert session.query(MyModel.name).order_by(MyModel.id).all() == [
+        ("Clark Kent",),
+        ("Lois Lane",),
+    ]
+
+
+def test_save_updates_instance(session) -> None:
+    instance = MyModel(name="Clark Kent", age=31, is_active=True)
+    session.add(instance)
+    session.commit()
+
+    serializer = MySerializer(instance, data={"age": 32}, partial=True)
+    assert serializer.is_valid()
+
+    assert serializer.save(session) is instance
+    session.commit()
+
+    assert session.query(MyModel.name, MyModel.age).all() == [
+        ("Clark Kent", 32)
+    ]
+
+
+def test_save_many(session) -> None:
+    serializer = MySerializer(
+        data=[
+            {"name": f"User {i}", "age": i, "is_active": i % 2}
+            for i in range(5)
+        ],
+        many=True,
+    )
+    assert serializer.is_valid()
+
+    assert serializer.save_many(session, batch_size=2) is None
+    session.commit()
+
+    assert session.query(MyModel.name, MyModel.is_active).all() == [
+        (f"User {i}", bool(i % 2)) for i in range(5)
+    ]
+
+
+def test_save_many_returning_primary_keys(session) -> None:
+    serializer = MySerializer(
+        data=[{"name": f"User {i}", "is_active": True} for i in range(3)],
+        many=True,
+    )
+    assert serializer.is_valid()
+
+    primary_keys = serializer.save_many(session, return_defaults=True)
+    session.commit()
+
+    assert primary_keys == [
+        id for id, in session.query(MyModel.id).order_by(MyModel.id)
+    ]
+    assert len(set(primary_keys)) == 3
+
+
+def test_save_requires_validated_data(session) -> None:
+    serializer = MySerializer(data={"name": "Clark Kent", "is_active": True})
+
+    with pytest.raises(InvalidDataException):
+        serializer.save(session)
+
+    serializer = MySerializer(data={"name": None, "is_active": True})
+    assert serializer.is_valid() is False
+
+    with pytest.raises(InvalidDataException):
+        serializer.save(session)
+
+    serializer = MySerializer(data=[{"name": None}], many=True)
+    assert serializer.is_valid() is False
+
+    with pytest.raises(InvalidDataException):
+        serializer.save_many(session)
@@ -0,0 +1,152 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+def test_schema_is_shared_between_instances() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    first = MySerializer()
+    second = MySerializer()
+
+    assert first.fields is second.fields
+    assert MySerializer.get_schema() is MySerializer.get_schema()
+
+
+def test_schema_is_not_shared_between_subclasses() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    class MyNameSerializer(MySerializer):
+        class Meta:
+            model = MyModel
+            fields = ["name"]
+
+    assert list(MySerializer().fields.keys()) == ["id", "name"]
+    assert list(MyNameSerializer().fields.keys()) == ["name"]
+
+
+def test_schema_is_rebuilt_when_meta_changes() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+            fields = ["id"]
+
+    schema = MySerializer.get_schema()
+    assert list(schema.fields.keys()) == ["id"]
+
+    MySerializer.Meta.fields = ["id", "name"]
+
+    assert MySerializer.get_schema() is not schema
+    assert list(MySerializer().fields.keys()) == ["id", "name"]
+
+
+def test_schema_invalidation() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    schema = MySerializer.get_schema()
+    MySerializer.invalidate_schema()
+
+    assert MySerializer.get_schema() is not schema
+
+
+def test_schema_field_table() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+        age = sqlalchemy.Column(sqlalchemy.Integer)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    schema = MySerializer.get_schema()
+
+    assert isinstance(schema.table, tuple)
+    assert [field.name for field in schema.table] == ["id", "name", "age"]
+    assert schema.index == {"id": 0, "name": 1, "age": 2}
+    assert schema.fields["name"] is schema.table[1]
+    assert schema.fields["name"].required is True
+    assert schema.fields["age"].required is False
+    assert isinstance(schema.fields["age"].validator, fields.IntegerField)
+    assert list(schema.fields) == ["id", "name", "age"]
+    assert len(schema.fields) == 3
+
+
+def test_columns_named_like_serializer_attributes() -> None:
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        context = sqlalchemy.Column(sqlalchemy.String)
+        instance = sqlalchemy.Column(sqlalchemy.String)
+        many = sqlalchemy.Column(sqlalchemy.String)
+        partial = sqlalchemy.Column(sqlalchemy.String)
+        schema = sqlalchemy.Column(sqlalchemy.String)
+        errors = sqlalchemy.Column(sqlalchemy.String)
+        profiler = sqlalchemy.Column(sqlalchemy.String)
+        project = sqlalchemy.Column(sqlalchemy.String)
+        profile = sqlalchemy.Column(sqlalchemy.String)
+        save = sqlalchemy.Column(sqlalchemy.String)
+
+        __tablename__ = "my_model"
+
+    class MySerializer(Serializer):
+        class Meta:
+            model = MyModel
+
+    values = {
+        key: f"my {key}"
+        for key in MySerializer.get_schema().fields
+        if key != "id"
+    }
+
+    assert MySerializer(MyModel(id=1, **values)).data == {"id": 1, **values}
+
+    serializer = MySerializer(data=values)
+    assert serializer.is_valid()
+    assert serializer.validated_data == values
@@ -0,0 +1,110 @@
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import Serializer
+from alcherializer.cache import LRUCache
+from alcherializer.schema import get_projection
+
+Base = declarative_base()
+
+
+class Manager(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    salary = sqlalchemy.Column(sqlalchemy.Integer)
+
+    __tablename__ = "manager"
+
+
+class User(Base):
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, nullable=False)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    email = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+    manager_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey(Manager.id)
+    )
+
+    manager = relationship(Manager)
+
+    __tablename__ = "user"
+
+
+class ManagerSerializer(Serializer):
+    class Meta:
+        model = Manager
+
+
+class UserSerializer(Serializer):
+    manager = ManagerSerializer()
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "email", "manager"]
+
+
+def get_user() -> User:
+    return User(
+        id=1,
+        name="Clark Kent",
+        email="clark@dailyplanet.com",
+        manager=Manager(id=2, name="Perry White", salary=100),
+    )
+
+
+def test_fields() -> None:
+    serializer = UserSerializer(get_user(), fields=["id", "name", "unknown"])
+
+    assert serializer.data == {"id": 1, "name": "Clark Kent"}
+    assert list(serializer.fields) == ["id", "name"]
+
+
+def test_fields_with_nested_paths() -> None:
+    serializer = UserSerializer(
+        [get_user()], many=True, fields=["id", "manager.name"]
+    )
+
+    assert serializer.data == [{"id": 1, "manager": {"name": "Perry White"}}]
+
+
+def test_exclude_with_nested_paths() -> None:
+    serializer = UserSerializer(get_user(), exclude=["email", "manager.salary"])
+
+    assert serializer.data == {
+        "id": 1,
+        "name": "Clark Kent",
+        "manager": {"id": 2, "name": "Perry White"},
+    }
+
+
+def test_projection_does_not_change_the_class_schema() -> None:
+    UserSerializer(get_user(), fields=["id"]).data
+
+    assert list(UserSerializer(get_user()).data) == [
+        "id",
+        "name",
+        "email",
+        "manager",
+    ]
+
+
+def test_projection_is_compiled_once() -> None:
+    first = UserSerializer(get_user(), fields=["id", "manager.name"])
+    second = UserSerializer(get_user(), fields=["id", "manager.name"])
+
+    assert first.schema is second.schema
+    assert first.schema is not UserSerializer.get_schema()
+    assert get_projection.cache_info().maxsize == 256
+
+
+def test_projection_skips_cache() -> None:
+    class MyUserSerializer(Serializer):
+        class Meta:
+            model = User
+            fields = ["id", "name"]
+            cache = LRUCache()
+
+    MyUserSerializer(get_user(), fields=["id"]).data
+
+    assert len(MyUserSerializer.Meta.cache) == 0
+    assert MyUserSerializer(get_user()).data == {"id": 1, "name": "Clark Kent"}
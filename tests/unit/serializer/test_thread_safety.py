@@ -0,0 +1,102 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+from alcherializer import (
+    Serializer,
+    fields,
+)
+
+
+@pytest.fixture
+def switch_interval():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_nested_serialization_from_many_threads(switch_interval) -> None:
+    class MyRelatedModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        hello = sqlalchemy.Column(sqlalchemy.String, nullable=False)
+
+        __tablename__ = "my_related_model"
+
+    class MyModel(declarative_base()):
+        id = sqlalchemy.Column(
+            sqlalchemy.Integer, primary_key=True, nullable=False
+        )
+        related_id = sqlalchemy.Column(
+            sqlalchemy.Integer, sqlalchemy.ForeignKey(MyRelatedModel.id)
+        )
+
+        related = relationship(MyRelatedModel, uselist=False)
+
+        __tablename__ = "my_model"
+
+    class MyRelatedModelSerializer(Serializer):
+        greeting = fields.MethodField()
+
+        def get_greeting(self, obj: MyRelatedModel) -> str:
+            return f"{obj.hello} {self.context['thread']}"
+
+        class Meta:
+            model = MyRelatedModel
+            fields = ["id", "greeting"]
+
+    class MyModelSerializer(Serializer):
+        related = MyRelatedModelSerializer()
+
+        class Meta:
+            model = MyModel
+            fields = ["id", "related"]
+
+    threads = 16
+    barrier = Barrier(threads)
+
+    def serialize(thread: int) -> bool:
+        single = MyModel(id=thread, related=MyRelatedModel(id=1, hello="hi"))
+        many = MyModel(
+            id=thread,
+            related=[MyRelatedModel(id=i, hello="hi") for i in range(3)],
+        )
+
+        barrier.wait()
+        for _ in range(200):
+            context = {"thread": thread}
+            single_data = MyModelSerializer(single, context=context).data
+            many_data = MyModelSerializer(
+                [many, single], many=True, context=context
+            ).data
+
+            assert single_data == {
+                "id": thread,
+                "related": {"id": 1, "greeting": f"hi {thread}"},
+            }
+            assert many_data == [
+                {
+                    "id": thread,
+                    "related": [
+                        {"id": i, "greeting": f"hi {thread}"} for i in range(3)
+                    ],
+                },
+                single_data,
+            ]
+
+        return True
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        assert all(executor.map(serialize, range(threads)))
+
+    shared = MyModelSerializer.related
+    assert shared.instance is None
+    assert shared.many is False
+    assert shared.context == {}
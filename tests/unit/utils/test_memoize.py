@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from alcherializer import utils
+
+
+class TestMemoize(TestCase):
+    def test_memoize(self) -> None:
+        calls = []
+
+        def double(value: int) -> int:
+            calls.append(value)
+            return value * 2
+
+        memoized = utils.memoize(double, lambda value: value, max_size=2)
+
+        self.assertEqual([memoized(value) for value in (1, 2, 1)], [2, 4, 2])
+        self.assertEqual(calls, [1, 2])
+
+        self.assertEqual(memoized(3), 6)
+        self.assertEqual(memoized(1), 2)
+        self.assertEqual(calls, [1, 2, 3, 1])
+
+    def test_memoize_many(self) -> None:
+        calls = []
+
+        def double_many(values):
+            calls.append(values)
+            return [value * 2 for value in values]
+
+        memoized = utils.memoize_many(
+            double_many, lambda value: value, max_size=2
+        )
+
+        self.assertEqual(memoized([1, 2, 1]), [2, 4, 2])
+        self.assertEqual(memoized([2, 3]), [4, 6])
+        self.assertEqual(memoized([1, 3]), [2, 6])
+        self.assertEqual(calls, [[1, 2], [3], [1]])